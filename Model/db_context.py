@@ -1,13 +1,97 @@
 """Database context for CRUD operations on Reddit data."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Union
 from pathlib import Path
 from contextlib import contextmanager
-from sqlalchemy import create_engine, desc, asc
+from sqlalchemy import (
+    create_engine, event, func, select, insert, update, delete, bindparam, Select
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.exc import IntegrityError
 from Model.base import Base
-from Model.reddit_source import RedditSource
+from Model.reddit_source import RedditSource, json_dumps, utc_now
+
+
+# Connection-level pragmas applied to every new SQLite connection.
+# WAL lets readers proceed while a writer commits, and synchronous=NORMAL
+# only fsyncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=30000000000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Rows per multi-VALUES statement, kept well under SQLite's bound-parameter limit
+BULK_CHUNK_SIZE = 500
+
+# Rows fetched per round trip when streaming results
+STREAM_BATCH_SIZE = 1000
+
+# Hot-path statements are built once at import so every call hands
+# SQLAlchemy the same construct and hits its compiled-statement cache
+# (engine echo reports "cached since" rather than "generated").
+SELECT_BY_SOURCE = select(RedditSource).where(
+    RedditSource.source == bindparam('source'),
+    RedditSource.source_id == bindparam('source_id')
+)
+DELETE_BY_SOURCE = delete(RedditSource).where(
+    RedditSource.source == bindparam('source'),
+    RedditSource.source_id == bindparam('source_id')
+)
+DELETE_ALL = delete(RedditSource)
+COUNT_ALL = select(func.count()).select_from(RedditSource)
+COUNT_BY_SOURCE = select(func.count()).select_from(RedditSource).where(
+    RedditSource.source == bindparam('source')
+)
+
+# Raw SQL for fast_bulk_insert; mirrors the conflict handling of upsert
+FAST_UPSERT_SQL = """
+    INSERT INTO RedditSource (
+        source, source_id, title, description, tags, score, score_dictionary,
+        processed, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
+    ON CONFLICT (source, source_id) DO UPDATE SET
+        title = excluded.title,
+        description = coalesce(excluded.description, description),
+        tags = coalesce(excluded.tags, tags),
+        score = coalesce(excluded.score, score),
+        score_dictionary = coalesce(excluded.score_dictionary, score_dictionary),
+        updated_at = excluded.updated_at
+"""
+
+# Columns list operations may sort by; unknown names fall back to score
+ORDER_COLUMNS = {
+    'id': RedditSource.id,
+    'source': RedditSource.source,
+    'source_id': RedditSource.source_id,
+    'title': RedditSource.title,
+    'score': RedditSource.score,
+    'created_at': RedditSource.created_at,
+    'updated_at': RedditSource.updated_at,
+}
+
+# Columns update_fields may set
+UPDATABLE_COLUMNS = frozenset({'title', 'description', 'tags', 'score',
+                               'score_dictionary', 'processed'})
+
+# Columns written by create_many and upsert operations
+WRITE_COLUMNS = ('source', 'source_id', 'title', 'description', 'tags',
+                  'score', 'score_dictionary')
+
+
+def _apply_sqlite_pragmas(dbapi_conn, connection_record):
+    """Apply performance pragmas to a freshly opened SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 class DBContext:
@@ -15,6 +99,12 @@ class DBContext:
     
     This class provides a clean interface for database operations using
     SQLAlchemy ORM with proper session management and error handling.
+    
+    Sessions are closed before records are returned, so any relationship
+    added to RedditSource must be declared with ``lazy='raise'`` and loaded
+    explicitly, e.g. ``select(RedditSource).options(selectinload(...))``
+    in the listing methods. Otherwise accessing it on a returned record
+    would issue one lazy query per row, or fail on the detached instance.
     """
     
     def __init__(self, db_path: str = "db.s3db"):
@@ -29,15 +119,47 @@ class DBContext:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Create engine and session factory
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        if db_path == ':memory:':
+            # Every connection to :memory: opens a separate empty database,
+            # so all sessions must share the one connection
+            pool_options = {'poolclass': StaticPool}
+        else:
+            # A QueuePool of thread-shareable connections lets WAL serve
+            # concurrent readers alongside a single writer
+            pool_options = {'poolclass': QueuePool, 'pool_size': 5, 'max_overflow': 10}
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            echo=False,
+            connect_args={'check_same_thread': False, 'timeout': 5.0},
+            **pool_options
+        )
+        event.listen(self.engine, 'connect', _apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         
         # Initialize database schema
         self._init_db()
     
     def _init_db(self):
-        """Initialize database schema if it doesn't exist."""
+        """Initialize database schema if it doesn't exist.
+        
+        Indexes are created individually as well, since ``create_all``
+        skips existing tables and would never add indexes introduced after
+        a database was first created.
+        
+        Also runs ``ANALYZE`` once on databases that have never been
+        analyzed, so the query planner has statistics for the indexes.
+        Later refreshes happen through ``PRAGMA optimize`` in :meth:`close`.
+        """
         Base.metadata.create_all(self.engine)
+        for index in RedditSource.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+        
+        with self.engine.begin() as conn:
+            analyzed = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).first()
+            if not analyzed:
+                conn.exec_driver_sql('ANALYZE')
     
     @contextmanager
     def get_session(self) -> Session:
@@ -74,34 +196,50 @@ class DBContext:
         Returns:
             Created RedditSource object or None on failure
         """
-        session = self.SessionLocal()
+        record = RedditSource(
+            source=source,
+            source_id=source_id,
+            title=title,
+            description=description,
+            tags=tags,
+            score=score,
+            score_dictionary=score_dictionary or None
+        )
+        
         try:
-            record = RedditSource(
-                source=source,
-                source_id=source_id,
-                title=title,
-                description=description,
-                tags=tags,
-                score=score
-            )
-            
-            if score_dictionary:
-                record.set_score_dict(score_dictionary)
-            
-            session.add(record)
-            session.commit()
-            session.refresh(record)
+            with self.get_session() as session:
+                session.add(record)
+                session.flush()
             return record
-            
         except IntegrityError:
             # Record with same source and source_id already exists
-            session.rollback()
             return None
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    
+    def create_many(self, records: List[Dict[str, Any]]) -> List[RedditSource]:
+        """Create many Reddit records in a single transaction.
+        
+        Rows are sent as one executemany, which SQLAlchemy batches into
+        multi-row ``INSERT ... RETURNING`` statements.
+        
+        Args:
+            records: List of dicts with the same keys accepted by :meth:`create`
+            
+        Returns:
+            Created RedditSource objects, in input order
+            
+        Raises:
+            IntegrityError: If any record duplicates an existing source/source_id;
+                no records are created in that case
+        """
+        if not records:
+            return []
+        
+        rows = [self._to_row(record) for record in records]
+        with self.get_session() as session:
+            return session.scalars(
+                insert(RedditSource).returning(RedditSource, sort_by_parameter_order=True),
+                rows
+            ).all()
     
     def read(self, source: str, source_id: str) -> Optional[RedditSource]:
         """Read a Reddit record by source and source_id.
@@ -114,10 +252,9 @@ class DBContext:
             RedditSource object or None if not found
         """
         with self.get_session() as session:
-            return session.query(RedditSource).filter_by(
-                source=source,
-                source_id=source_id
-            ).first()
+            return session.execute(
+                SELECT_BY_SOURCE, {'source': source, 'source_id': source_id}
+            ).scalar_one_or_none()
     
     def read_by_id(self, record_id: int) -> Optional[RedditSource]:
         """Read a Reddit record by ID.
@@ -129,7 +266,7 @@ class DBContext:
             RedditSource object or None if not found
         """
         with self.get_session() as session:
-            return session.query(RedditSource).filter_by(id=record_id).first()
+            return session.get(RedditSource, record_id)
     
     def update(self, source: str, source_id: str,
                title: Optional[str] = None,
@@ -137,7 +274,8 @@ class DBContext:
                tags: Optional[str] = None,
                score: Optional[float] = None,
                score_dictionary: Optional[Dict[str, Any]] = None,
-               processed: Optional[bool] = None) -> Optional[RedditSource]:
+               processed: Optional[bool] = None,
+               return_obj: bool = True) -> Union[RedditSource, bool, None]:
         """Update an existing Reddit record.
         
         Args:
@@ -149,15 +287,33 @@ class DBContext:
             score: New score (optional)
             score_dictionary: New score dictionary (optional)
             processed: New processed status (optional)
+            return_obj: Load and return the updated record. When False, a
+                single UPDATE is issued via :meth:`update_fields` and a bool
+                is returned instead.
             
         Returns:
-            Updated RedditSource object or None if not found
+            Updated RedditSource object or None if not found; with
+            ``return_obj=False``, True if a record was updated, else False
+            (including when no fields were given)
         """
+        if not return_obj:
+            fields = {
+                'title': title,
+                'description': description,
+                'tags': tags,
+                'score': score,
+                'score_dictionary': score_dictionary,
+                'processed': processed,
+            }
+            fields = {key: value for key, value in fields.items() if value is not None}
+            if not fields:
+                return False
+            return self.update_fields(source, source_id, **fields) > 0
+        
         with self.get_session() as session:
-            record = session.query(RedditSource).filter_by(
-                source=source,
-                source_id=source_id
-            ).first()
+            record = session.execute(
+                SELECT_BY_SOURCE, {'source': source, 'source_id': source_id}
+            ).scalar_one_or_none()
             
             if record:
                 if title is not None:
@@ -169,16 +325,44 @@ class DBContext:
                 if score is not None:
                     record.score = score
                 if score_dictionary is not None:
-                    record.set_score_dict(score_dictionary)
+                    record.score_dictionary = score_dictionary
                 if processed is not None:
                     record.processed = processed
                 
-                session.commit()
-                session.refresh(record)
+                # Flush so the Python-side updated_at is applied to the
+                # instance; the commit happens when the session scope exits
+                session.flush()
                 return record
             
             return None
     
+    def update_fields(self, source: str, source_id: str, **fields: Any) -> int:
+        """Update columns of a record without loading it.
+        
+        Args:
+            source: Source platform
+            source_id: Source-specific ID
+            **fields: Column values to set
+            
+        Returns:
+            Number of rows updated
+            
+        Raises:
+            ValueError: If a field is not an updatable column
+        """
+        unknown = set(fields) - UPDATABLE_COLUMNS
+        if unknown:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
+        
+        stmt = (
+            update(RedditSource)
+            .where(RedditSource.source == source, RedditSource.source_id == source_id)
+            .values(**fields)
+            .execution_options(synchronize_session=False)
+        )
+        with self.get_session() as session:
+            return session.execute(stmt).rowcount
+    
     def upsert(self, source: str, source_id: str, title: str,
                description: Optional[str] = None, tags: Optional[str] = None,
                score: Optional[float] = None,
@@ -197,28 +381,160 @@ class DBContext:
         Returns:
             RedditSource object (created or updated)
         """
-        existing = self.read(source, source_id)
-        
-        if existing:
-            return self.update(
-                source=source,
-                source_id=source_id,
-                title=title,
-                description=description,
-                tags=tags,
-                score=score,
-                score_dictionary=score_dictionary
-            )
-        else:
-            return self.create(
-                source=source,
-                source_id=source_id,
-                title=title,
-                description=description,
-                tags=tags,
-                score=score,
-                score_dictionary=score_dictionary
+        row = self._to_row({
+            'source': source,
+            'source_id': source_id,
+            'title': title,
+            'description': description,
+            'tags': tags,
+            'score': score,
+            'score_dictionary': score_dictionary,
+        })
+        
+        with self.get_session() as session:
+            return session.scalars(
+                self._upsert_statement([row]).returning(RedditSource),
+                execution_options={'populate_existing': True}
+            ).one()
+    
+    def bulk_upsert(self, records: List[Dict[str, Any]]) -> List[RedditSource]:
+        """Insert or update many Reddit records in a single transaction.
+        
+        Each record is a dict with the same keys accepted by :meth:`upsert`.
+        Rows are written with ``INSERT ... ON CONFLICT DO UPDATE`` in chunks
+        of :data:`BULK_CHUNK_SIZE`. Records repeating a source/source_id are
+        merged first, as consecutive upserts would be: later values win and
+        None keeps the earlier value.
+        
+        Args:
+            records: List of record dictionaries
+            
+        Returns:
+            List of RedditSource objects (created or updated), one per
+            distinct source/source_id, in order of first appearance
+        """
+        rows = self._merge_duplicate_rows(self._to_row(record) for record in records)
+        results = []
+        
+        with self.get_session() as session:
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                stmt = self._upsert_statement(rows[start:start + BULK_CHUNK_SIZE])
+                results.extend(session.scalars(
+                    stmt.returning(RedditSource),
+                    execution_options={'populate_existing': True}
+                ).all())
+        
+        return results
+    
+    def fast_bulk_insert(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update many records through the raw DBAPI connection.
+        
+        Bypasses the ORM entirely and hands rows straight to
+        ``sqlite3.Cursor.executemany`` in one transaction. Conflicts are
+        resolved like :meth:`bulk_upsert`, but no objects are returned.
+        
+        Args:
+            records: Iterable of dicts with the same keys accepted by :meth:`upsert`
+            
+        Returns:
+            Number of rows inserted or updated
+        """
+        now = utc_now().strftime('%Y-%m-%d %H:%M:%S.%f')
+        rows = (
+            (
+                record['source'],
+                record['source_id'],
+                record['title'],
+                record.get('description'),
+                record.get('tags'),
+                record.get('score'),
+                json_dumps(record['score_dictionary'])
+                if record.get('score_dictionary') is not None else None,
+                now,
+                now,
             )
+            for record in records
+        )
+        
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            try:
+                cursor.executemany(FAST_UPSERT_SQL, rows)
+                raw.commit()
+                return cursor.rowcount
+            except Exception:
+                raw.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            raw.close()
+    
+    @staticmethod
+    def _upsert_statement(rows: List[Dict[str, Any]]):
+        """Build an ``INSERT ... ON CONFLICT DO UPDATE`` statement for rows.
+        
+        On conflict, columns given as None keep their stored value, matching
+        the behaviour of :meth:`update`.
+        
+        Args:
+            rows: Normalized rows from :meth:`_to_row`
+            
+        Returns:
+            SQLite insert statement with an upsert clause
+        """
+        stmt = sqlite_insert(RedditSource).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=['source', 'source_id'],
+            set_={
+                'title': stmt.excluded.title,
+                'description': func.coalesce(stmt.excluded.description,
+                                             RedditSource.description),
+                'tags': func.coalesce(stmt.excluded.tags, RedditSource.tags),
+                'score': func.coalesce(stmt.excluded.score, RedditSource.score),
+                'score_dictionary': func.coalesce(stmt.excluded.score_dictionary,
+                                                  RedditSource.score_dictionary),
+                'updated_at': stmt.excluded.updated_at,
+            }
+        )
+    
+    @staticmethod
+    def _merge_duplicate_rows(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge rows sharing a source/source_id into one row per key.
+        
+        A multi-row upsert touching the same key twice would return the
+        record twice, with stale values, so duplicates are folded together
+        with the same rules the upsert applies on conflict.
+        
+        Args:
+            rows: Normalized rows from :meth:`_to_row`
+            
+        Returns:
+            One row per key, in order of first appearance
+        """
+        merged = {}
+        for row in rows:
+            key = (row['source'], row['source_id'])
+            if key in merged:
+                merged[key].update(
+                    (column, value) for column, value in row.items() if value is not None
+                )
+            else:
+                merged[key] = row
+        return list(merged.values())
+    
+    @staticmethod
+    def _to_row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a record dict into column values for a bulk write.
+        
+        Args:
+            record: Record dictionary as accepted by :meth:`create`
+            
+        Returns:
+            Dictionary with a value for every write column
+        """
+        return {column: record.get(column) for column in WRITE_COLUMNS}
     
     def delete(self, source: str, source_id: str) -> bool:
         """Delete a Reddit record.
@@ -231,46 +547,99 @@ class DBContext:
             True if deleted, False if not found
         """
         with self.get_session() as session:
-            record = session.query(RedditSource).filter_by(
-                source=source,
-                source_id=source_id
-            ).first()
-            
-            if record:
-                session.delete(record)
-                session.commit()
-                return True
-            
-            return False
+            return session.execute(
+                DELETE_BY_SOURCE, {'source': source, 'source_id': source_id}
+            ).rowcount > 0
     
     def list_all(self, limit: Optional[int] = None,
                  order_by: str = 'score',
                  ascending: bool = False) -> List[RedditSource]:
         """List all Reddit records.
         
+        Returns full ORM instances, detached from their (closed) session,
+        for callers that pass records on to write methods. Read-only
+        callers should prefer :meth:`list_all_rows` or :meth:`iter_all`.
+        
         Args:
             limit: Maximum number of results
-            order_by: Column to order by ('score', 'created_at', 'updated_at')
+            order_by: Column to order by ('id', 'source', 'source_id', 'title',
+                'score', 'created_at', 'updated_at'); unknown names order by score
             ascending: Sort in ascending order (default: descending)
             
         Returns:
             List of RedditSource objects
         """
+        stmt = self._list_statement(select(RedditSource), limit, order_by, ascending)
         with self.get_session() as session:
-            query = session.query(RedditSource)
+            return session.scalars(stmt).all()
+    
+    def iter_all(self, limit: Optional[int] = None,
+                 order_by: str = 'score',
+                 ascending: bool = False) -> Iterator[RedditSource]:
+        """Stream Reddit records without materializing the full result.
+        
+        Rows are fetched in batches of :data:`STREAM_BATCH_SIZE`; the
+        session stays open until the generator is exhausted or closed.
+        
+        Args:
+            limit: Maximum number of results
+            order_by: Column to order by ('id', 'source', 'source_id', 'title',
+                'score', 'created_at', 'updated_at'); unknown names order by score
+            ascending: Sort in ascending order (default: descending)
             
-            # Apply ordering
-            order_column = getattr(RedditSource, order_by, RedditSource.score)
-            if ascending:
-                query = query.order_by(asc(order_column))
-            else:
-                query = query.order_by(desc(order_column))
+        Yields:
+            RedditSource objects
+        """
+        stmt = self._list_statement(select(RedditSource), limit, order_by, ascending)
+        with self.get_session() as session:
+            yield from session.scalars(
+                stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+    
+    def list_all_rows(self, limit: Optional[int] = None,
+                      order_by: str = 'score',
+                      ascending: bool = False) -> List[Dict[str, Any]]:
+        """List all Reddit records as plain column dictionaries.
+        
+        Skips ORM instance construction, so it is the cheaper choice for
+        callers that only format or export records.
+        
+        Args:
+            limit: Maximum number of results
+            order_by: Column to order by ('id', 'source', 'source_id', 'title',
+                'score', 'created_at', 'updated_at'); unknown names order by score
+            ascending: Sort in ascending order (default: descending)
             
-            # Apply limit
-            if limit:
-                query = query.limit(limit)
+        Returns:
+            List of dictionaries keyed by column name
+        """
+        stmt = self._list_statement(
+            select(*RedditSource.__table__.columns), limit, order_by, ascending
+        )
+        with self.get_session() as session:
+            return [dict(row) for row in session.execute(stmt).mappings()]
+    
+    @staticmethod
+    def _list_statement(stmt: Select, limit: Optional[int],
+                        order_by: str, ascending: bool) -> Select:
+        """Apply ordering and limit to a listing statement.
+        
+        Args:
+            stmt: Base select statement
+            limit: Maximum number of results
+            order_by: Column to order by
+            ascending: Sort in ascending order
             
-            return query.all()
+        Returns:
+            Ordered and limited select statement
+        """
+        order_column = ORDER_COLUMNS.get(order_by, RedditSource.score)
+        stmt = stmt.order_by(order_column.asc() if ascending else order_column.desc())
+        
+        if limit:
+            stmt = stmt.limit(limit)
+        
+        return stmt
     
     def count(self) -> int:
         """Get total count of records.
@@ -279,7 +648,7 @@ class DBContext:
             Total number of records
         """
         with self.get_session() as session:
-            return session.query(RedditSource).count()
+            return session.execute(COUNT_ALL).scalar_one()
     
     def count_by_source(self, source: str) -> int:
         """Get count of records by source.
@@ -291,7 +660,9 @@ class DBContext:
             Number of records from the source
         """
         with self.get_session() as session:
-            return session.query(RedditSource).filter_by(source=source).count()
+            return session.execute(
+                COUNT_BY_SOURCE, {'source': source}
+            ).scalar_one()
     
     def clear_all(self) -> int:
         """Clear all records from the database.
@@ -300,14 +671,28 @@ class DBContext:
             Number of records deleted
         """
         with self.get_session() as session:
-            count = session.query(RedditSource).count()
-            session.query(RedditSource).delete()
-            session.commit()
-            return count
+            return session.execute(DELETE_ALL).rowcount
+    
+    def checkpoint(self):
+        """Checkpoint the write-ahead log and truncate it to zero bytes.
+        
+        Long-running ingest jobs can call this periodically to keep the
+        ``-wal`` file from growing without bound.
+        """
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
     
     def close(self):
-        """Close database connection."""
+        """Close database connection.
+        
+        Runs ``PRAGMA optimize`` so SQLite can refresh planner statistics,
+        and checkpoints the write-ahead log, before the connection pool is
+        disposed.
+        """
         if hasattr(self, 'engine'):
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql('PRAGMA optimize')
+            self.checkpoint()
             self.engine.dispose()
     
     def __enter__(self):
@@ -4,13 +4,63 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 import json
 from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, Index
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import validates
 from Model.base import Base
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 def utc_now():
-    """Get current UTC time in a timezone-aware manner."""
-    return datetime.now(timezone.utc)
+    """Get current UTC time as a naive datetime.
+    
+    SQLite DateTime columns store no timezone and load values back naive,
+    so defaults are naive UTC as well. Records just written then match the
+    same records read back, and their timestamps can be compared.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def json_loads(value: str) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class JSONEncoded(TypeDecorator):
+    """Text column that stores Python values as JSON.
+    
+    Stored values that are not valid JSON load as None.
+    """
+    
+    impl = Text
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        """Serialize a Python value for storage."""
+        if value is None:
+            return None
+        return json_dumps(value)
+    
+    def process_result_value(self, value, dialect):
+        """Deserialize a stored JSON string."""
+        if not value:
+            return None
+        try:
+            return json_loads(value)
+        except ValueError:
+            return None
 
 
 class RedditSource(Base):
@@ -36,7 +86,7 @@ class RedditSource(Base):
     
     # Scoring
     score = Column(Float, nullable=True)
-    score_dictionary = Column(Text, nullable=True)  # JSON string
+    score_dictionary = Column(JSONEncoded, nullable=True)
     
     # Processing status - False on creation, set to True by builder after transformation
     processed = Column(Boolean, default=False, nullable=False, index=True)
@@ -45,21 +95,26 @@ class RedditSource(Base):
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
     
+    # Relationships added here must use lazy='raise' and be loaded explicitly
+    # with selectinload() in DBContext queries, since records are returned
+    # detached from their session.
+    
     # Indexes for performance
     __table_args__ = (
         Index('ix_source_source_id', 'source', 'source_id', unique=True),
         Index('ix_score', 'score'),
         Index('ix_created_at', 'created_at'),
+        Index('ix_updated_at', 'updated_at'),
         Index('ix_processed', 'processed'),
     )
     
     @validates('score_dictionary')
     def validate_score_dictionary(self, key, value):
-        """Validate that score_dictionary is valid JSON."""
+        """Accept a dict, or a JSON string which is parsed into one."""
         if value is not None and isinstance(value, str):
             try:
-                json.loads(value)
-            except json.JSONDecodeError:
+                return json_loads(value)
+            except ValueError:
                 raise ValueError(f"Invalid JSON for score_dictionary: {value}")
         return value
     
@@ -77,7 +132,8 @@ class RedditSource(Base):
             'description': self.description,
             'tags': self.tags,
             'score': self.score,
-            'score_dictionary': self.score_dictionary,
+            'score_dictionary': (json_dumps(self.score_dictionary)
+                                 if self.score_dictionary is not None else None),
             'processed': self.processed,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
@@ -86,26 +142,24 @@ class RedditSource(Base):
     def get_score_dict(self) -> Optional[Dict[str, Any]]:
         """Get score dictionary as a Python dict.
         
+        Kept for backward compatibility; ``score_dictionary`` already holds
+        the decoded value.
+        
         Returns:
-            Parsed score dictionary or None
+            Score dictionary or None
         """
-        if self.score_dictionary:
-            try:
-                return json.loads(self.score_dictionary)
-            except json.JSONDecodeError:
-                return None
-        return None
+        return self.score_dictionary
     
     def set_score_dict(self, score_dict: Dict[str, Any]) -> None:
         """Set score dictionary from a Python dict.
         
+        Kept for backward compatibility; assigning ``score_dictionary``
+        directly is equivalent.
+        
         Args:
             score_dict: Dictionary to store
         """
-        if score_dict is not None:
-            self.score_dictionary = json.dumps(score_dict)
-        else:
-            self.score_dictionary = None
+        self.score_dictionary = score_dict
     
     def __repr__(self) -> str:
         """String representation of the model."""
@@ -19,11 +19,56 @@ Requirements:
 
 import sys
 import time
+import queue
+import threading
 from datetime import datetime
 
+from Model.db_context import DBContext
+
 # Flag to enable/disable scraping demo (disabled by default for ToS compliance)
 ENABLE_SCRAPING_DEMO = False
 
+# Database the API demo persists fetched posts to
+DEMO_DB_PATH = "reddit_demo.db"
+
+# Posts buffered before each database write
+PERSIST_BATCH_SIZE = 100
+
+# Marks the end of the fetch queue
+_FETCH_DONE = object()
+
+
+def _submission_to_record(submission):
+    """Convert a PRAW submission into a DBContext record dict"""
+    return {
+        'source': 'reddit',
+        'source_id': submission.id,
+        'title': submission.title,
+        'description': submission.selftext or None,
+        'tags': submission.link_flair_text,
+        'score': float(submission.score),
+        'score_dictionary': {
+            'upvotes': submission.score,
+            'comments': submission.num_comments,
+            'upvote_ratio': submission.upvote_ratio,
+        },
+    }
+
+
+def _fetch_submissions(submissions, fetch_queue):
+    """Drain a PRAW listing into a queue from a background thread.
+    
+    Network fetches then overlap with the consumer's database writes.
+    Any error is forwarded through the queue before the end marker.
+    """
+    try:
+        for submission in submissions:
+            fetch_queue.put(submission)
+    except Exception as e:
+        fetch_queue.put(e)
+    finally:
+        fetch_queue.put(_FETCH_DONE)
+
 
 def demo_api_approach():
     """
@@ -104,20 +149,46 @@ for i, submission in enumerate(subreddit.top(time_filter='week', limit=10), 1):
         start_time = time.time()
         posts_collected = 0
         
-        for i, submission in enumerate(subreddit.top(time_filter='week', limit=10), 1):
-            posts_collected += 1
-            print(f"{i}. {submission.title[:70]}...")
-            print(f"   Score: {submission.score:,} | Comments: {submission.num_comments:,}")
-            print(f"   Flair: {submission.link_flair_text}")
-            print(f"   Upvote Ratio: {submission.upvote_ratio:.2%}")
-            print(f"   Author: u/{submission.author}")
-            print(f"   Created: {datetime.fromtimestamp(submission.created_utc)}")
-            print(f"   URL: https://reddit.com{submission.permalink}")
-            print()
+        # Fetch in a background thread and persist in batches as posts arrive
+        fetch_queue = queue.Queue(maxsize=PERSIST_BATCH_SIZE)
+        fetcher = threading.Thread(
+            target=_fetch_submissions,
+            args=(subreddit.top(time_filter='week', limit=10), fetch_queue),
+            daemon=True
+        )
+        fetcher.start()
+        
+        buffer = []
+        with DBContext(DEMO_DB_PATH) as db:
+            while True:
+                submission = fetch_queue.get()
+                if submission is _FETCH_DONE:
+                    break
+                if isinstance(submission, Exception):
+                    raise submission
+                
+                posts_collected += 1
+                print(f"{posts_collected}. {submission.title[:70]}...")
+                print(f"   Score: {submission.score:,} | Comments: {submission.num_comments:,}")
+                print(f"   Flair: {submission.link_flair_text}")
+                print(f"   Upvote Ratio: {submission.upvote_ratio:.2%}")
+                print(f"   Author: u/{submission.author}")
+                print(f"   Created: {datetime.fromtimestamp(submission.created_utc)}")
+                print(f"   URL: https://reddit.com{submission.permalink}")
+                print()
+                
+                buffer.append(_submission_to_record(submission))
+                if len(buffer) >= PERSIST_BATCH_SIZE:
+                    db.bulk_upsert(buffer)
+                    buffer.clear()
+            
+            if buffer:
+                db.bulk_upsert(buffer)
         
         elapsed = time.time() - start_time
         
         print(f"\n✅ Successfully collected {posts_collected} posts in {elapsed:.2f} seconds")
+        print(f"✅ Posts saved to {DEMO_DB_PATH}")
         print(f"✅ All data is structured and reliable")
         print(f"✅ Code is maintainable and won't break")
         
@@ -74,8 +74,8 @@ def main():
         }
     ]
     
-    for post in posts:
-        record = db.upsert(**post)
+    records = db.bulk_upsert(posts)
+    for record in records:
         print(f"   ✓ Created: {record.title[:50]}...")
     print()
     
@@ -89,7 +89,7 @@ def main():
     print("4. Top posts by score:")
     top_posts = db.list_all(limit=3, order_by='score', ascending=False)
     for i, post in enumerate(top_posts, 1):
-        score_dict = post.get_score_dict()
+        score_dict = post.score_dictionary
         print(f"   {i}. {post.title}")
         print(f"      Score: {post.score} | Upvotes: {score_dict.get('upvotes', 0)} | "
               f"Comments: {score_dict.get('comments', 0)}")
@@ -104,7 +104,7 @@ def main():
         print(f"   Tags: {post.tags}")
         print(f"   Score: {post.score}")
         print(f"   Processed: {post.processed}")
-        score_dict = post.get_score_dict()
+        score_dict = post.score_dictionary
         print(f"   Score details: {json.dumps(score_dict, indent=6)}")
     print()
     
@@ -113,7 +113,8 @@ def main():
     updated = db.update(
         source='reddit',
         source_id='r/python_post_123',
-        processed=True
+        processed=True,
+        return_obj=False
     )
     if updated:
         print(f"   ✓ Post marked as processed")
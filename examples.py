@@ -6,16 +6,47 @@ Practical examples for collecting and analyzing Reddit data following best pract
 
 Requirements:
     pip install praw vaderSentiment textblob scikit-learn
+    pip install asyncpraw  # optional, for AsyncRedditDataCollector
+    pip install orjson  # optional, faster RedditDataCollector.save_posts
+    pip install transformers optimum[onnxruntime]  # optional, SentimentAnalyzer(backend='onnx')
 """
 
 import praw
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import pandas as pd
+import sys
 import time
 import logging
-from datetime import datetime, timedelta
-from collections import Counter
-from typing import List, Dict, Any, Optional
+import multiprocessing
+import os
+import asyncio
+import functools
+import gzip
+import heapq
+import inspect
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import closing, contextmanager
+from itertools import islice
+import pickle
+import sqlite3
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from collections import Counter, deque
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 import re
 
+try:
+    import orjson
+except ImportError:  # optional speedup for save_posts
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,45 +55,369 @@ logging.basicConfig(
 logger = logging.getLogger('RedditCollector')
 
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+@functools.lru_cache(maxsize=1024)
+def iso_from_timestamp(timestamp: float) -> str:
+    """
+    Convert a Unix timestamp to a local-time ISO 8601 string
+    
+    Memoized, since comments in a thread and posts in a burst often share
+    timestamps.
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+# ============================================================================
+# DATA MODEL
+# ============================================================================
+
+@dataclass
+class RedditPost:
+    """Compact record of a Reddit submission
+    
+    Slotted, so each post costs far less memory than a dict with the same
+    keys. Item access (post.score, post.get('flair')) is supported for
+    code written against the older dict records. The analyzers take
+    RedditPost objects; use from_dict to convert post dicts, such as those
+    loaded from save_posts output.
+    """
+    
+    # Declared by hand as dataclass(slots=True) needs Python 3.10; keep in
+    # sync with the fields below, which must not get class-level defaults
+    __slots__ = (
+        'id', 'title', 'selftext', 'url', 'permalink', 'score', 'upvote_ratio',
+        'num_comments', 'created_utc', 'subreddit', 'author', 'flair', 'gilded',
+        'stickied', 'over_18', 'is_self', 'domain',
+    )
+    
+    id: str
+    title: str
+    selftext: str
+    url: str
+    permalink: str
+    score: int
+    upvote_ratio: float
+    num_comments: int
+    created_utc: float
+    subreddit: str
+    author: str
+    flair: Optional[str]
+    gilded: int
+    stickied: bool
+    over_18: bool
+    is_self: bool
+    domain: str
+    
+    @property
+    def created_datetime(self) -> str:
+        """Creation time as a local-time ISO 8601 string"""
+        return iso_from_timestamp(self.created_utc)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning default for unknown keys"""
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary, including created_datetime"""
+        data = asdict(self)
+        data['created_datetime'] = self.created_datetime
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RedditPost':
+        """Build a post from a dictionary, ignoring keys that are not fields
+        
+        Accepts the output of to_dict and the post dicts of earlier versions.
+        """
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__})
+
+
 # ============================================================================
 # RATE LIMITER
 # ============================================================================
 
 class RateLimiter:
-    """Rate limiter to respect Reddit API limits (60 requests/minute)"""
+    """Rate limiter to respect Reddit API limits (60 requests/minute)
     
-    def __init__(self, max_requests: int = 60, time_window: int = 60):
+    Implemented as a token bucket: up to max_requests tokens, refilled
+    continuously at max_requests per time_window seconds. Safe to share
+    between threads. A disabled limiter never waits, for when PRAW's own
+    header-driven pacing is relied on instead.
+    """
+    
+    def __init__(self, max_requests: int = 60, time_window: int = 60,
+                 enabled: bool = True):
+        self.enabled = enabled
         self.max_requests = max_requests
         self.time_window = time_window  # seconds
-        self.requests = []
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it
+        
+        Tokens may go negative; each caller waits for its own share of the
+        refill, so concurrent callers are spaced out evenly.
+        """
+        if not self.enabled:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            
+            # Refill tokens for the time elapsed since the last call
+            self.tokens = min(
+                self.max_requests,
+                self.tokens + (now - self.last_refill) * self.max_requests / self.time_window
+            )
+            self.last_refill = now
+            
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens * self.time_window / self.max_requests
     
     def wait_if_needed(self):
         """Wait if rate limit would be exceeded"""
-        now = datetime.now()
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached. Waiting {sleep_time:.2f} seconds...")
+            time.sleep(sleep_time)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Rate limiter for coroutines; waits with asyncio.sleep instead of blocking"""
+    
+    async def wait_if_needed(self):
+        """Wait if rate limit would be exceeded"""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached. Waiting {sleep_time:.2f} seconds...")
+            await asyncio.sleep(sleep_time)
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+DEFAULT_CACHE_DIR = '~/.cache/reddit_collector'
+
+# Bump when the shape of cached results changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 3
+
+
+class ResponseCache:
+    """Persistent SQLite-backed cache of collector results
+    
+    Entries are pickled and stamped with the fetch time and PRAW version;
+    entries written by a different PRAW version, or that fail to unpickle,
+    are treated as misses.
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            cache_dir: Directory holding the cache database
+        """
+        directory = Path(cache_dir).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / 'cache.db'
+        
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " fetched_at REAL NOT NULL,"
+                " praw_version TEXT NOT NULL,"
+                " value BLOB NOT NULL)"
+            )
+    
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection, safe to use from any thread
+        
+        The transaction is committed (or rolled back) and the connection
+        closed on exit; sqlite3's own context manager does not close it.
+        """
+        with closing(sqlite3.connect(self.path, timeout=5.0)) as conn, conn:
+            yield conn
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value for key if younger than ttl seconds"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT fetched_at, praw_version, value FROM cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        fetched_at, praw_version, value = row
+        if praw_version != praw.__version__ or time.time() - fetched_at >= ttl:
+            return None
+        
+        # Entries that can no longer be unpickled (e.g. a class that moved)
+        # are treated as misses and overwritten by the next fetch
+        try:
+            return pickle.loads(value)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+    
+    def set(self, key: str, value: Any):
+        """Store value under key, stamped with the current time"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, fetched_at, praw_version, value) "
+                "VALUES (?, ?, ?, ?)",
+                (key, time.time(), praw.__version__, pickle.dumps(value))
+            )
+    
+    def clear(self):
+        """Remove every cached entry"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache")
+
+
+class PartialFetchError(Exception):
+    """Raised by a cached collector method whose fetch failed part-way
+    
+    Carries the results gathered before the failure; the cached wrapper
+    returns them to the caller without storing them.
+    """
+    
+    def __init__(self, message: str, partial: Any):
+        super().__init__(message)
+        self.partial = partial
+
+
+def cached(ttl: float, encode: Optional[Callable[[Any], Any]] = None,
+           decode: Optional[Callable[[Any], Any]] = None):
+    """
+    Cache a RedditDataCollector method's result in its ResponseCache
+    
+    The cache key is the method name plus its bound arguments (defaults
+    included). Cache hits skip the API call and the rate limiter entirely.
+    Only complete results are cached: a method signals a failed fetch by
+    raising PartialFetchError, whose partial results are returned uncached,
+    and empty results are never stored. The wrapped method accepts
+    force_refresh=True to bypass the cache.
+    
+    Args:
+        ttl: Seconds a cached result stays valid
+        encode: Converts a result to plain built-in types before it is
+                pickled, so entries do not depend on class import paths
+        decode: Rebuilds a result from its encoded form on a cache hit
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
         
-        # Remove old requests outside time window
-        cutoff = now - timedelta(seconds=self.time_window)
-        self.requests = [req for req in self.requests if req > cutoff]
+        def fetch(self, args, kwargs):
+            """Call method, returning (result, complete)"""
+            try:
+                return method(self, *args, **kwargs), True
+            except PartialFetchError as e:
+                return e.partial, False
         
-        # Wait if at limit
-        if len(self.requests) >= self.max_requests:
-            sleep_time = (self.requests[0] + timedelta(seconds=self.time_window) - now).total_seconds()
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached. Waiting {sleep_time:.2f} seconds...")
-                time.sleep(sleep_time + 0.1)
-                self.requests = []
+        @functools.wraps(method)
+        def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            if self.cache is None:
+                return fetch(self, args, kwargs)[0]
+            
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = sorted(
+                (name, value) for name, value in bound.arguments.items() if name != 'self'
+            )
+            key = f"v{CACHE_FORMAT_VERSION}:{method.__name__}:{arguments!r}"
+            
+            if not force_refresh:
+                result = self.cache.get(key, ttl)
+                if result is not None:
+                    logger.debug(f"Cache hit for {key}")
+                    return decode(result) if decode else result
+            
+            result, complete = fetch(self, args, kwargs)
+            if complete and result:
+                self.cache.set(key, encode(result) if encode else result)
+            return result
         
-        self.requests.append(now)
+        return wrapper
+    return decorator
+
+
+def _posts_to_dicts(posts: List[RedditPost]) -> List[Dict[str, Any]]:
+    """Encode posts for the response cache"""
+    return [asdict(post) for post in posts]
+
+
+def _posts_from_dicts(rows: List[Dict[str, Any]]) -> List[RedditPost]:
+    """Rebuild posts read from the response cache"""
+    return [RedditPost.from_dict(row) for row in rows]
 
 
 # ============================================================================
 # MAIN COLLECTOR CLASS
 # ============================================================================
 
+# Submission attributes read for each RedditPost, in RedditPost field order
+_POST_FIELDS = (
+    'id', 'title', 'selftext', 'url', 'permalink', 'score', 'upvote_ratio',
+    'num_comments', 'created_utc', 'subreddit.display_name', 'author',
+    'link_flair_text', 'gilded', 'stickied', 'over_18', 'is_self', 'domain',
+)
+_POST_GETTER = attrgetter(*_POST_FIELDS)
+
+
 class RedditDataCollector:
-    """Main class for collecting Reddit data"""
+    """Main class for collecting Reddit data
+    
+    PRAW clients and their requests sessions are not thread-safe, so the
+    reddit attribute gives each thread its own client. The *_many and
+    *_batch methods rely on this to fan requests out across threads.
+    
+    Those threads belong to a pool kept for the collector's lifetime, so
+    their clients and sessions are reused from one call to the next. Call
+    close(), or use the collector as a context manager, to shut it down.
+    """
     
-    def __init__(self, client_id: str, client_secret: str, user_agent: str):
+    # Keep-alive HTTP sessions, one per thread, shared by every collector so
+    # connections (and their TLS handshakes) are reused across instances
+    _http_sessions = threading.local()
+    
+    @classmethod
+    def _shared_http_session(cls) -> requests.Session:
+        """Return this thread's keep-alive HTTP session, creating it on first use"""
+        session = getattr(cls._http_sessions, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            ))
+            cls._http_sessions.session = session
+        return session
+    
+    def __init__(self, client_id: str, client_secret: str, user_agent: str,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 use_internal_rate_limit: bool = True, max_workers: int = 10):
         """
         Initialize Reddit API client
         
@@ -70,17 +425,58 @@ class RedditDataCollector:
             client_id: Reddit app client ID
             client_secret: Reddit app client secret
             user_agent: Descriptive user agent string
+            cache_dir: Directory for the on-disk response cache (None disables caching)
+            use_internal_rate_limit: Rely on PRAW's built-in pacing, which follows
+                                     Reddit's X-Ratelimit headers; set False to also
+                                     apply our fixed 60 requests/minute limiter. The
+                                     concurrent *_many and *_batch methods always
+                                     apply it, since PRAW paces each thread's client
+                                     separately
+            max_workers: Size of the worker thread pool used by the *_many and
+                         *_batch methods, which caps their max_workers argument
         """
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent
-        )
+        self._credentials = {
+            'client_id': client_id,
+            'client_secret': client_secret,
+            'user_agent': user_agent,
+        }
+        self._local = threading.local()
+        self._local.reddit = self._create_reddit()
+        self.use_internal_rate_limit = use_internal_rate_limit
         self.rate_limiter = RateLimiter()
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
         logger.info("RedditDataCollector initialized")
     
+    def _wait_for_rate_limit(self):
+        """Take a token from the shared rate limiter when PRAW's pacing is not enough
+        
+        PRAW only paces its own client, so requests from thread pool workers,
+        each with a client of its own, always go through the shared limiter.
+        """
+        if not self.use_internal_rate_limit or getattr(self._local, 'fan_out', False):
+            self.rate_limiter.wait_if_needed()
+    
+    def _create_reddit(self) -> praw.Reddit:
+        """Create a PRAW client on the calling thread's HTTP session"""
+        return praw.Reddit(
+            **self._credentials,
+            requestor_kwargs={'session': self._shared_http_session()}
+        )
+    
+    @property
+    def reddit(self) -> praw.Reddit:
+        """PRAW client for the calling thread, created on first use"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = self._create_reddit()
+        return reddit
+    
+    @cached(ttl=300, encode=_posts_to_dicts, decode=_posts_from_dicts)
     def collect_posts(self, subreddit_name: str, limit: int = 100, 
-                     sort_by: str = 'hot', time_filter: str = 'day') -> List[Dict[str, Any]]:
+                     sort_by: str = 'hot', time_filter: str = 'day') -> List[RedditPost]:
         """
         Collect posts from a subreddit
         
@@ -89,11 +485,12 @@ class RedditDataCollector:
             limit: Maximum number of posts to collect
             sort_by: Sort method ('hot', 'new', 'top', 'rising')
             time_filter: Time filter for 'top' ('hour', 'day', 'week', 'month', 'year', 'all')
+            force_refresh: Skip the response cache and refetch
         
         Returns:
-            List of post dictionaries
+            List of posts
         """
-        self.rate_limiter.wait_if_needed()
+        self._wait_for_rate_limit()
         
         subreddit = self.reddit.subreddit(subreddit_name)
         posts = []
@@ -119,32 +516,99 @@ class RedditDataCollector:
             
         except Exception as e:
             logger.error(f"Error collecting posts from r/{subreddit_name}: {e}")
+            raise PartialFetchError(str(e), posts) from e
         
         return posts
     
-    def _extract_post_data(self, submission) -> Dict[str, Any]:
+    def collect_posts_many(self, subreddit_names: List[str], max_workers: int = 10,
+                           **kwargs) -> Dict[str, List[RedditPost]]:
+        """
+        Collect posts from several subreddits concurrently
+        
+        Each worker thread uses its own PRAW client (see the class docstring)
+        and takes tokens from the shared rate limiter, so the overall request
+        rate stays within the API limit.
+        
+        Args:
+            subreddit_names: Names of the subreddits (without r/)
+            max_workers: Maximum number of concurrent fetches
+            **kwargs: Passed through to collect_posts
+        
+        Returns:
+            Dictionary mapping subreddit name to its list of posts
+        """
+        return self._map_concurrently(
+            lambda name: self.collect_posts(name, **kwargs), subreddit_names, max_workers
+        )
+    
+    def _map_concurrently(self, func, items: List[str], max_workers: int) -> Dict[str, Any]:
+        """Apply func to each item on the worker pool, keyed by item
+        
+        func must reach the API through self.reddit, so each worker thread
+        uses its own PRAW client. Workers are marked as fan-out threads so
+        their requests are always paced by the shared rate limiter. At most
+        max_workers items (and never more than the pool size) run at once.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if not items:
+            return {}
+        
+        slots = threading.BoundedSemaphore(max_workers)
+        
+        def run(item):
+            self._local.fan_out = True
+            with slots:
+                return func(item)
+        
+        return dict(zip(items, self._get_executor().map(run, items)))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, creating it on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='reddit-collector'
+                )
+            return self._executor
+    
+    def close(self):
+        """Shut down the worker pool, waiting for running fetches to finish
+        
+        The collector stays usable; the next concurrent call starts a new pool.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+    
+    @staticmethod
+    def _extract_post_data(submission) -> RedditPost:
         """Extract relevant data from a Reddit submission"""
-        return {
-            'id': submission.id,
-            'title': submission.title,
-            'selftext': submission.selftext if submission.is_self else '',
-            'url': submission.url,
-            'permalink': f"https://reddit.com{submission.permalink}",
-            'score': submission.score,
-            'upvote_ratio': submission.upvote_ratio,
-            'num_comments': submission.num_comments,
-            'created_utc': submission.created_utc,
-            'created_datetime': datetime.fromtimestamp(submission.created_utc).isoformat(),
-            'subreddit': submission.subreddit.display_name,
-            'author': str(submission.author) if submission.author else '[deleted]',
-            'flair': submission.link_flair_text,
-            'gilded': submission.gilded,
-            'stickied': submission.stickied,
-            'over_18': submission.over_18,
-            'is_self': submission.is_self,
-            'domain': submission.domain,
-        }
+        (post_id, title, selftext, url, permalink, score, upvote_ratio,
+         num_comments, created_utc, subreddit, author, flair, gilded,
+         stickied, over_18, is_self, domain) = _POST_GETTER(submission)
+        
+        # Subreddit, author, flair and domain repeat across posts, so intern
+        # them to share one string object per distinct value
+        return RedditPost(
+            post_id, title, selftext if is_self else '', url,
+            f"https://reddit.com{permalink}", score, upvote_ratio,
+            num_comments, created_utc, sys.intern(subreddit),
+            sys.intern(str(author)) if author else '[deleted]',
+            sys.intern(flair) if flair else flair, gilded,
+            stickied, over_18, is_self, sys.intern(domain),
+        )
     
+    @cached(ttl=300)
     def collect_comments(self, post_id: str, max_comments: int = 100) -> List[Dict[str, Any]]:
         """
         Collect comments from a post
@@ -152,37 +616,121 @@ class RedditDataCollector:
         Args:
             post_id: Reddit post ID
             max_comments: Maximum number of comments to collect
+            force_refresh: Skip the response cache and refetch
         
         Returns:
             List of comment dictionaries
         """
-        self.rate_limiter.wait_if_needed()
+        self._wait_for_rate_limit()
+        return self._collect_submission_comments(
+            self.reddit.submission(id=post_id), max_comments
+        )
+    
+    @staticmethod
+    def _walk_comments(forest):
+        """
+        Yield comments breadth-first, in the same order as CommentForest.list()
         
+        Unlike list(), this does not flatten the whole tree up front, so
+        callers that only need the first few comments can stop early.
+        """
+        queue = deque(forest)
+        while queue:
+            comment = queue.popleft()
+            yield comment
+            replies = getattr(comment, 'replies', None)
+            if replies:
+                queue.extend(replies)
+    
+    def _collect_submission_comments(self, submission,
+                                     max_comments: int) -> List[Dict[str, Any]]:
+        """Resolve a submission's comment tree and extract up to max_comments
+        
+        Raises:
+            PartialFetchError: If fetching fails, carrying the comments
+                               extracted so far
+        """
+        comments = []
         try:
-            submission = self.reddit.submission(id=post_id)
             submission.comments.replace_more(limit=0)  # Remove "load more" objects
             
-            comments = []
-            for comment in submission.comments.list()[:max_comments]:
+            for comment in islice(self._walk_comments(submission.comments), max_comments):
                 if isinstance(comment, praw.models.Comment):
                     comment_data = self._extract_comment_data(comment)
                     comments.append(comment_data)
             
-            logger.info(f"Collected {len(comments)} comments from post {post_id}")
+            logger.info(f"Collected {len(comments)} comments from post {submission.id}")
             return comments
             
         except Exception as e:
-            logger.error(f"Error collecting comments from post {post_id}: {e}")
-            return []
+            logger.error(f"Error collecting comments from post {submission.id}: {e}")
+            raise PartialFetchError(str(e), comments) from e
     
-    def _extract_comment_data(self, comment) -> Dict[str, Any]:
+    def collect_comments_batch(self, post_ids: List[str], max_comments: int = 100,
+                               max_workers: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect comments from many posts, skipping posts that no longer exist
+        
+        Posts are first looked up with reddit.info(), one request per 100
+        IDs, and only those that still exist are passed to
+        collect_comments_many (and so through the response cache). This
+        saves requests only when many IDs are deleted or missing; for lists
+        of live posts it costs ceil(N/100) extra requests over calling
+        collect_comments_many directly.
+        
+        Args:
+            post_ids: Reddit post IDs
+            max_comments: Maximum number of comments to collect per post
+            max_workers: Maximum number of concurrent comment fetches
+        
+        Returns:
+            Dictionary mapping post ID to its list of comments (empty for
+            posts that were not found)
+        """
+        fullnames = [f"t3_{post_id}" for post_id in post_ids]
+        
+        # One rate-limit token per info() page of up to 100 posts
+        for _ in range(0, len(fullnames), 100):
+            self._wait_for_rate_limit()
+        
+        try:
+            found_ids = {submission.id for submission in self.reddit.info(fullnames=fullnames)}
+        except Exception as e:
+            logger.error(f"Error loading posts for comment collection: {e}")
+            return {post_id: [] for post_id in post_ids}
+        
+        comments = self.collect_comments_many(
+            [post_id for post_id in post_ids if post_id in found_ids],
+            max_workers=max_workers, max_comments=max_comments
+        )
+        return {post_id: comments.get(post_id, []) for post_id in post_ids}
+    
+    def collect_comments_many(self, post_ids: List[str], max_workers: int = 10,
+                              **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect comments from several posts concurrently
+        
+        Args:
+            post_ids: Reddit post IDs
+            max_workers: Maximum number of concurrent fetches
+            **kwargs: Passed through to collect_comments
+        
+        Returns:
+            Dictionary mapping post ID to its list of comments
+        """
+        return self._map_concurrently(
+            lambda post_id: self.collect_comments(post_id, **kwargs), post_ids, max_workers
+        )
+    
+    @staticmethod
+    def _extract_comment_data(comment) -> Dict[str, Any]:
         """Extract relevant data from a Reddit comment"""
         return {
             'id': comment.id,
             'body': comment.body,
             'score': comment.score,
             'created_utc': comment.created_utc,
-            'created_datetime': datetime.fromtimestamp(comment.created_utc).isoformat(),
+            'created_datetime': iso_from_timestamp(comment.created_utc),
             'author': str(comment.author) if comment.author else '[deleted]',
             'parent_id': comment.parent_id,
             'depth': comment.depth,
@@ -190,17 +738,19 @@ class RedditDataCollector:
             'gilded': comment.gilded,
         }
     
+    @cached(ttl=3600)
     def get_subreddit_info(self, subreddit_name: str) -> Dict[str, Any]:
         """
         Get information about a subreddit
         
         Args:
             subreddit_name: Name of the subreddit (without r/)
+            force_refresh: Skip the response cache and refetch
         
         Returns:
             Dictionary with subreddit information
         """
-        self.rate_limiter.wait_if_needed()
+        self._wait_for_rate_limit()
         
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
@@ -212,7 +762,7 @@ class RedditDataCollector:
                 'subscribers': subreddit.subscribers,
                 'active_users': subreddit.active_user_count,
                 'created_utc': subreddit.created_utc,
-                'created_datetime': datetime.fromtimestamp(subreddit.created_utc).isoformat(),
+                'created_datetime': iso_from_timestamp(subreddit.created_utc),
                 'over_18': subreddit.over18,
                 'activity_rate': subreddit.active_user_count / max(subreddit.subscribers, 1),
             }
@@ -220,6 +770,187 @@ class RedditDataCollector:
         except Exception as e:
             logger.error(f"Error getting info for r/{subreddit_name}: {e}")
             return {}
+    
+    def get_subreddit_info_many(self, subreddit_names: List[str],
+                                max_workers: int = 10) -> Dict[str, Dict[str, Any]]:
+        """
+        Get information about several subreddits concurrently
+        
+        Args:
+            subreddit_names: Names of the subreddits (without r/)
+            max_workers: Maximum number of concurrent fetches
+        
+        Returns:
+            Dictionary mapping subreddit name to its information
+        """
+        return self._map_concurrently(self.get_subreddit_info, subreddit_names, max_workers)
+    
+    @staticmethod
+    def save_posts(posts: List[RedditPost], path: Union[str, Path]) -> Path:
+        """
+        Save posts to a JSON file as an array of objects
+        
+        Uses orjson when installed. Paths ending in .gz are written
+        gzip-compressed (level 3, which favours speed over ratio).
+        
+        Args:
+            posts: Posts to save
+            path: Output file path
+        
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        if orjson is not None:
+            data = orjson.dumps(posts, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps([asdict(post) for post in posts]) + '\n').encode()
+        
+        if path.suffix == '.gz':
+            with gzip.open(path, 'wb', compresslevel=3) as f:
+                f.write(data)
+        else:
+            path.write_bytes(data)
+        
+        logger.info(f"Saved {len(posts)} posts to {path}")
+        return path
+
+
+# ============================================================================
+# ASYNC COLLECTOR
+# ============================================================================
+
+class AsyncRedditDataCollector:
+    """Asynchronous collector built on Async PRAW
+    
+    Lets many API calls overlap on one event loop. Requires asyncpraw
+    (pip install asyncpraw); use as an async context manager or call
+    close() when done.
+    """
+    
+    def __init__(self, client_id: str, client_secret: str, user_agent: str,
+                 use_internal_rate_limit: bool = True):
+        """
+        Initialize Async PRAW client
+        
+        Args:
+            client_id: Reddit app client ID
+            client_secret: Reddit app client secret
+            user_agent: Descriptive user agent string
+            use_internal_rate_limit: Rely on Async PRAW's built-in pacing; set
+                                     False to also apply our fixed limiter
+        """
+        import asyncpraw
+        
+        self.reddit = asyncpraw.Reddit(
+            client_id=client_id,
+            client_secret=client_secret,
+            user_agent=user_agent
+        )
+        self.rate_limiter = AsyncRateLimiter(enabled=not use_internal_rate_limit)
+        logger.info("AsyncRedditDataCollector initialized")
+    
+    async def collect_posts(self, subreddit_name: str, limit: int = 100,
+                            sort_by: str = 'hot', time_filter: str = 'day') -> List[RedditPost]:
+        """
+        Collect posts from a subreddit
+        
+        Args:
+            subreddit_name: Name of the subreddit (without r/)
+            limit: Maximum number of posts to collect
+            sort_by: Sort method ('hot', 'new', 'top', 'rising')
+            time_filter: Time filter for 'top' ('hour', 'day', 'week', 'month', 'year', 'all')
+        
+        Returns:
+            List of posts
+        """
+        await self.rate_limiter.wait_if_needed()
+        
+        posts = []
+        
+        try:
+            subreddit = await self.reddit.subreddit(subreddit_name)
+            
+            if sort_by == 'hot':
+                submissions = subreddit.hot(limit=limit)
+            elif sort_by == 'new':
+                submissions = subreddit.new(limit=limit)
+            elif sort_by == 'top':
+                submissions = subreddit.top(time_filter=time_filter, limit=limit)
+            elif sort_by == 'rising':
+                submissions = subreddit.rising(limit=limit)
+            else:
+                raise ValueError(f"Invalid sort_by value: {sort_by}")
+            
+            async for submission in submissions:
+                posts.append(RedditDataCollector._extract_post_data(submission))
+            
+            logger.info(f"Collected {len(posts)} posts from r/{subreddit_name}")
+            
+        except Exception as e:
+            logger.error(f"Error collecting posts from r/{subreddit_name}: {e}")
+        
+        return posts
+    
+    async def collect_comments(self, post_id: str, max_comments: int = 100) -> List[Dict[str, Any]]:
+        """
+        Collect comments from a post
+        
+        Args:
+            post_id: Reddit post ID
+            max_comments: Maximum number of comments to collect
+        
+        Returns:
+            List of comment dictionaries
+        """
+        import asyncpraw
+        
+        await self.rate_limiter.wait_if_needed()
+        
+        try:
+            submission = await self.reddit.submission(post_id)
+            await submission.comments.replace_more(limit=0)  # Remove "load more" objects
+            
+            comments = []
+            for comment in islice(submission.comments.list(), max_comments):
+                if isinstance(comment, asyncpraw.models.Comment):
+                    comments.append(RedditDataCollector._extract_comment_data(comment))
+            
+            logger.info(f"Collected {len(comments)} comments from post {post_id}")
+            return comments
+            
+        except Exception as e:
+            logger.error(f"Error collecting comments from post {post_id}: {e}")
+            return []
+    
+    async def collect_many(self, subreddit_names: List[str],
+                           **kwargs) -> Dict[str, List[RedditPost]]:
+        """
+        Collect posts from several subreddits concurrently
+        
+        Args:
+            subreddit_names: Names of the subreddits (without r/)
+            **kwargs: Passed through to collect_posts
+        
+        Returns:
+            Dictionary mapping subreddit name to its list of posts
+        """
+        results = await asyncio.gather(
+            *(self.collect_posts(name, **kwargs) for name in subreddit_names)
+        )
+        return dict(zip(subreddit_names, results))
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        await self.reddit.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
 
 
 # ============================================================================
@@ -230,41 +961,101 @@ class EngagementAnalyzer:
     """Analyze engagement metrics from Reddit posts"""
     
     @staticmethod
-    def calculate_engagement_velocity(post: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate how quickly a post gains engagement"""
-        created_utc = post['created_utc']
-        age_hours = (datetime.now().timestamp() - created_utc) / 3600
+    def calculate_engagement_velocity(post: RedditPost,
+                                      now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Calculate how quickly a post gains engagement
+        
+        Args:
+            post: Post to analyze
+            now: Current Unix timestamp; pass one value for a whole batch
+                 to avoid reading the clock per post
+        """
+        if now is None:
+            now = time.time()
+        age_hours = (now - post.created_utc) / 3600
         
         if age_hours <= 0:
             age_hours = 0.1  # Avoid division by zero
         
         return {
             'age_hours': age_hours,
-            'score_per_hour': post['score'] / age_hours,
-            'comments_per_hour': post['num_comments'] / age_hours,
+            'score_per_hour': post.score / age_hours,
+            'comments_per_hour': post.num_comments / age_hours,
         }
     
     @staticmethod
-    def calculate_engagement_quality(post: Dict[str, Any]) -> float:
+    def calculate_engagement_quality(post: RedditPost) -> float:
         """
         Calculate engagement quality score
         Higher score indicates more discussion and community recognition
         """
-        score = max(post['score'], 1)
-        comment_ratio = post['num_comments'] / score
-        upvote_ratio = post['upvote_ratio']
+        comment_ratio = post.num_comments / max(post.score, 1)
         
         # Quality factors
         discussion_score = min(comment_ratio * 100, 100)  # Cap at 100
-        agreement_score = upvote_ratio * 100
+        agreement_score = post.upvote_ratio * 100
         
-        quality_score = (discussion_score + agreement_score) / 2
-        return quality_score
+        return (discussion_score + agreement_score) / 2
+    
+    @staticmethod
+    def calculate_batch(posts: List[RedditPost],
+                        now: Optional[float] = None) -> pd.DataFrame:
+        """
+        Calculate velocity and quality metrics for many posts at once
+        
+        Vectorized equivalent of calling calculate_engagement_velocity and
+        calculate_engagement_quality on each post.
+        
+        Args:
+            posts: List of posts
+            now: Current Unix timestamp (defaults to the current time)
+        
+        Returns:
+            DataFrame with one row per post, in input order, with columns
+            age_hours, score_per_hour, comments_per_hour and quality_score
+        """
+        if now is None:
+            now = time.time()
+        count = len(posts)
+        
+        score = np.fromiter((post.score for post in posts), dtype=float, count=count)
+        num_comments = np.fromiter((post.num_comments for post in posts), dtype=float, count=count)
+        upvote_ratio = np.fromiter((post.upvote_ratio for post in posts), dtype=float, count=count)
+        created_utc = np.fromiter((post.created_utc for post in posts), dtype=float, count=count)
+        
+        age_hours = (now - created_utc) / 3600
+        age_hours = np.where(age_hours <= 0, 0.1, age_hours)  # Avoid division by zero
+        
+        return pd.DataFrame({
+            'age_hours': age_hours,
+            'score_per_hour': score / age_hours,
+            'comments_per_hour': num_comments / age_hours,
+            'quality_score': EngagementAnalyzer._quality_array(score, num_comments, upvote_ratio),
+        })
     
     @staticmethod
-    def is_trending(post: Dict[str, Any], min_velocity: float = 10.0) -> bool:
+    def calculate_quality_batch(posts: List[RedditPost]) -> np.ndarray:
+        """Vectorized calculate_engagement_quality, one score per post in input order"""
+        count = len(posts)
+        score = np.fromiter((post.score for post in posts), dtype=float, count=count)
+        num_comments = np.fromiter((post.num_comments for post in posts), dtype=float, count=count)
+        upvote_ratio = np.fromiter((post.upvote_ratio for post in posts), dtype=float, count=count)
+        return EngagementAnalyzer._quality_array(score, num_comments, upvote_ratio)
+    
+    @staticmethod
+    def _quality_array(score: np.ndarray, num_comments: np.ndarray,
+                       upvote_ratio: np.ndarray) -> np.ndarray:
+        """Quality score formula of calculate_engagement_quality over arrays"""
+        discussion_score = np.minimum(num_comments / np.maximum(score, 1) * 100, 100)
+        agreement_score = upvote_ratio * 100
+        return (discussion_score + agreement_score) / 2
+    
+    @staticmethod
+    def is_trending(post: RedditPost, min_velocity: float = 10.0,
+                    now: Optional[float] = None) -> bool:
         """Determine if a post is trending based on engagement velocity"""
-        velocity = EngagementAnalyzer.calculate_engagement_velocity(post)
+        velocity = EngagementAnalyzer.calculate_engagement_velocity(post, now)
         return velocity['score_per_hour'] >= min_velocity
 
 
@@ -275,15 +1066,127 @@ class EngagementAnalyzer:
 class SentimentAnalyzer:
     """Analyze sentiment from Reddit posts and comments"""
     
-    def __init__(self):
-        """Initialize sentiment analyzer"""
+    # Result used for empty text or when no backend is available
+    NEUTRAL_RESULT = {
+        'compound': 0.0,
+        'positive': 0.0,
+        'neutral': 1.0,
+        'negative': 0.0,
+        'classification': 'neutral'
+    }
+    
+    # Default model for the 'onnx' backend
+    DEFAULT_ONNX_MODEL = 'distilbert-base-uncased-finetuned-sst-2-english'
+    
+    # Where the 'onnx' backend keeps its exported, INT8-quantized models
+    DEFAULT_ONNX_CACHE_DIR = f'{DEFAULT_CACHE_DIR}/onnx'
+    
+    # File names used by optimum for exported and quantized models
+    ONNX_FILE = 'model.onnx'
+    QUANTIZED_ONNX_FILE = 'model_quantized.onnx'
+    
+    def __init__(self, backend: str = 'vader', cache_size: int = 8192,
+                 onnx_model: str = DEFAULT_ONNX_MODEL,
+                 onnx_cache_dir: str = DEFAULT_ONNX_CACHE_DIR):
+        """
+        Initialize sentiment analyzer
+        
+        Backends are loaded lazily on first use.
+        
+        Args:
+            backend: 'vader' (default) or 'onnx' for batched transformer
+                     inference in analyze_texts (needs transformers and optimum[onnxruntime])
+            cache_size: Number of distinct texts whose VADER scores are memoized
+            onnx_model: Model name or local directory for the 'onnx' backend. A
+                        directory already holding model_quantized.onnx is used as is
+            onnx_cache_dir: Directory for the INT8-quantized export of onnx_model,
+                            created the first time the 'onnx' backend is used
+        """
+        if backend not in ('vader', 'onnx'):
+            raise ValueError(f"Invalid backend value: {backend}")
+        self.backend = backend
+        self.cache_size = cache_size
+        self.onnx_model = onnx_model
+        self.onnx_cache_dir = onnx_cache_dir
+    
+    # Lazily loaded backends are per process; drop them when pickling so the
+    # analyzer can be shipped to worker processes
+    _LAZY_ATTRIBUTES = ('vader', '_polarity_scores', '_onnx_pipeline')
+    
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if k not in self._LAZY_ATTRIBUTES}
+    
+    @functools.cached_property
+    def vader(self):
+        """VADER analyzer, imported on first access (None if not installed)"""
         try:
             from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-            self.vader = SentimentIntensityAnalyzer()
-            self.vader_available = True
+            return SentimentIntensityAnalyzer()
         except ImportError:
             logger.warning("vaderSentiment not available. Install with: pip install vaderSentiment")
-            self.vader_available = False
+            return None
+    
+    @property
+    def vader_available(self) -> bool:
+        """Whether VADER could be loaded"""
+        return self.vader is not None
+    
+    @functools.cached_property
+    def _polarity_scores(self):
+        """VADER polarity_scores memoized by text, since thread replies often repeat"""
+        return functools.lru_cache(maxsize=self.cache_size)(self.vader.polarity_scores)
+    
+    @functools.cached_property
+    def _onnx_pipeline(self):
+        """Transformer sentiment pipeline on ONNX Runtime (None if unavailable)"""
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            from transformers import AutoTokenizer, pipeline
+        except ImportError:
+            logger.warning("ONNX backend not available. Install with: "
+                           "pip install transformers optimum[onnxruntime]. Falling back to VADER")
+            return None
+        
+        model_dir = self._quantized_onnx_model()
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_dir, file_name=self.QUANTIZED_ONNX_FILE
+        )
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        return pipeline('sentiment-analysis', model=model, tokenizer=tokenizer)
+    
+    def _quantized_onnx_model(self) -> Path:
+        """
+        Return a directory holding an INT8-quantized ONNX export of onnx_model
+        
+        The model is exported to ONNX (unless onnx_model already holds an
+        ONNX file) and dynamically quantized to INT8 once; later calls
+        reuse the files saved under onnx_cache_dir.
+        """
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+        
+        source = Path(self.onnx_model).expanduser()
+        if (source / self.QUANTIZED_ONNX_FILE).exists():
+            return source
+        
+        target = Path(self.onnx_cache_dir).expanduser() / source.name
+        if (target / self.QUANTIZED_ONNX_FILE).exists():
+            return target
+        
+        logger.info(f"Exporting {self.onnx_model} to INT8 ONNX in {target}")
+        model = ORTModelForSequenceClassification.from_pretrained(
+            self.onnx_model, export=not (source / self.ONNX_FILE).exists()
+        )
+        model.save_pretrained(target)
+        AutoTokenizer.from_pretrained(self.onnx_model).save_pretrained(target)
+        
+        quantizer = ORTQuantizer.from_pretrained(target, file_name=self.ONNX_FILE)
+        quantizer.quantize(
+            save_dir=target,
+            quantization_config=AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        )
+        return target
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -295,16 +1198,10 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with sentiment scores
         """
-        if not self.vader_available or not text:
-            return {
-                'compound': 0.0,
-                'positive': 0.0,
-                'neutral': 1.0,
-                'negative': 0.0,
-                'classification': 'neutral'
-            }
+        if not text or not self.vader_available:
+            return dict(self.NEUTRAL_RESULT)
         
-        scores = self.vader.polarity_scores(text)
+        scores = self._polarity_scores(text)
         
         # Classify based on compound score
         if scores['compound'] > 0.05:
@@ -322,14 +1219,64 @@ class SentimentAnalyzer:
             'classification': classification
         }
     
-    def analyze_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_texts(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many texts
+        
+        Duplicate texts are scored once. With the 'onnx' backend, texts are
+        run through the transformer model in batches; otherwise each text
+        goes through the memoized VADER path.
+        
+        Args:
+            texts: Texts to analyze
+            batch_size: Texts per inference batch for the 'onnx' backend
+        
+        Returns:
+            List of sentiment dictionaries, in input order
+        """
+        unique_texts = list(dict.fromkeys(text for text in texts if text))
+        
+        pipe = self._onnx_pipeline if self.backend == 'onnx' else None
+        if pipe is None:
+            results = {text: self.analyze_text(text) for text in unique_texts}
+        else:
+            predictions = pipe(unique_texts, batch_size=batch_size, truncation=True)
+            results = {
+                text: self._from_prediction(prediction)
+                for text, prediction in zip(unique_texts, predictions)
+            }
+        
+        return [dict(results[text]) if text else dict(self.NEUTRAL_RESULT) for text in texts]
+    
+    @staticmethod
+    def _from_prediction(prediction: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a POSITIVE/NEGATIVE classifier prediction onto the VADER-style result"""
+        confidence = prediction['score']
+        if prediction['label'].upper().startswith('POS'):
+            compound = confidence
+        else:
+            compound = -confidence
+        
+        return {
+            'compound': compound,
+            'positive': max(compound, 0.0),
+            'neutral': 1.0 - confidence,
+            'negative': max(-compound, 0.0),
+            'classification': 'positive' if compound > 0 else 'negative'
+        }
+    
+    @staticmethod
+    def post_text(post: RedditPost) -> str:
+        """Text of a post as scored by analyze_post (title + content)"""
+        return f"{post.title} {post.selftext}"
+    
+    def analyze_post(self, post: RedditPost) -> Dict[str, Any]:
         """Analyze sentiment of a post (title + content)"""
-        text = f"{post['title']} {post['selftext']}"
-        return self.analyze_text(text)
+        return self.analyze_text(self.post_text(post))
     
-    def analyze_engagement_sentiment(self, post: Dict[str, Any]) -> Dict[str, str]:
+    def analyze_engagement_sentiment(self, post: RedditPost) -> Dict[str, str]:
         """Analyze sentiment based on engagement metrics"""
-        upvote_ratio = post['upvote_ratio']
+        upvote_ratio = post.upvote_ratio
         
         if upvote_ratio > 0.85:
             sentiment = 'very_positive'
@@ -341,7 +1288,7 @@ class SentimentAnalyzer:
             sentiment = 'negative'
         
         # Calculate controversy (high comments relative to score)
-        controversy = post['num_comments'] / max(post['score'], 1)
+        controversy = post.num_comments / max(post.score, 1)
         
         return {
             'engagement_sentiment': sentiment,
@@ -349,6 +1296,25 @@ class SentimentAnalyzer:
         }
 
 
+# Analyzer of the current worker process, installed by _init_sentiment_worker
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def _init_sentiment_worker(analyzer: SentimentAnalyzer):
+    """Process pool initializer: keep one analyzer for the worker's lifetime
+    
+    The analyzer is unpickled once per process rather than once per task, and
+    its backend, loaded on first use, then serves every batch the worker runs.
+    """
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_texts_in_worker(texts: List[str]) -> List[Dict[str, Any]]:
+    """Score a batch of texts with the worker's analyzer"""
+    return _worker_analyzer.analyze_texts(texts)
+
+
 # ============================================================================
 # TOPIC EXTRACTION
 # ============================================================================
@@ -357,69 +1323,87 @@ class TopicExtractor:
     """Extract trending topics and keywords from Reddit posts"""
     
     # Common English stop words
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         'the', 'is', 'in', 'and', 'to', 'of', 'for', 'with', 'on', 'this', 
         'that', 'are', 'was', 'be', 'by', 'at', 'from', 'or', 'an', 'as',
         'it', 'can', 'will', 'but', 'not', 'you', 'your', 'we', 'my', 'me',
         'i', 'a', 'has', 'have', 'had', 'what', 'when', 'where', 'who', 'how'
-    }
+    })
+    
+    # Words of three or more ASCII letters
+    WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
     
     @staticmethod
-    def extract_keywords(posts: List[Dict[str, Any]], top_n: int = 20) -> List[tuple]:
+    def extract_keywords(posts: List[RedditPost], top_n: int = 20,
+                         min_count: int = 1) -> List[tuple]:
         """
         Extract most common keywords from post titles
         
         Args:
-            posts: List of post dictionaries
+            posts: List of posts
             top_n: Number of top keywords to return
+            min_count: Ignore words seen fewer times than this
         
         Returns:
             List of (keyword, count) tuples
         """
-        # Combine all titles
-        all_text = ' '.join([post['title'] for post in posts])
+        find_words = TopicExtractor.WORD_PATTERN.findall
         
-        # Tokenize (simple word extraction)
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text.lower())
+        # Count words title by title; Counter tallies the findall list in C,
+        # and stop words are dropped once afterwards instead of per token
+        word_counts = Counter()
+        for post in posts:
+            word_counts.update(find_words(post.title.lower()))
+        for stop_word in TopicExtractor.STOP_WORDS:
+            word_counts.pop(stop_word, None)
         
-        # Remove stop words
-        words = [w for w in words if w not in TopicExtractor.STOP_WORDS]
+        candidates = word_counts.items()
+        if min_count > 1:
+            candidates = [(w, c) for w, c in candidates if c >= min_count]
         
-        # Count frequency
-        word_counts = Counter(words)
-        return word_counts.most_common(top_n)
+        return heapq.nlargest(top_n, candidates, key=itemgetter(1))
     
     @staticmethod
-    def extract_trending_flairs(posts: List[Dict[str, Any]], top_n: int = 10) -> List[tuple]:
+    def extract_trending_flairs(posts: List[RedditPost], top_n: int = 10) -> List[tuple]:
         """
         Extract most common post flairs
         
         Args:
-            posts: List of post dictionaries
+            posts: List of posts
             top_n: Number of top flairs to return
         
         Returns:
             List of (flair, count) tuples
         """
-        flairs = [post['flair'] for post in posts if post.get('flair')]
+        flairs = [post.flair for post in posts if post.flair]
         flair_counts = Counter(flairs)
         return flair_counts.most_common(top_n)
     
     @staticmethod
-    def get_top_posts_by_engagement(posts: List[Dict[str, Any]], top_n: int = 10) -> List[Dict[str, Any]]:
-        """Get top posts sorted by engagement quality"""
-        analyzer = EngagementAnalyzer()
+    def get_top_posts_by_engagement(posts: List[RedditPost],
+                                    top_n: int = 10) -> List[Tuple[RedditPost, float]]:
+        """
+        Get top posts sorted by engagement quality
         
-        # Calculate quality scores
-        posts_with_quality = []
-        for post in posts:
-            post_copy = post.copy()
-            post_copy['quality_score'] = analyzer.calculate_engagement_quality(post)
-            posts_with_quality.append(post_copy)
+        Args:
+            posts: List of posts
+            top_n: Number of top posts to return
         
-        # Sort by quality score
-        sorted_posts = sorted(posts_with_quality, key=lambda x: x['quality_score'], reverse=True)
-        return sorted_posts[:top_n]
+        Returns:
+            List of (post, quality_score) tuples, best first
+        """
+        if not posts or top_n <= 0:
+            return []
+        
+        quality = EngagementAnalyzer.calculate_quality_batch(posts)
+        if top_n < len(quality):
+            # Partial selection is O(N); only the top_n candidates get sorted
+            candidates = np.argpartition(quality, -top_n)[-top_n:]
+        else:
+            candidates = np.arange(len(quality))
+        top_indices = candidates[np.argsort(-quality[candidates], kind='stable')]
+        
+        return [(posts[i], float(quality[i])) for i in top_indices]
 
 
 # ============================================================================
@@ -444,9 +1428,12 @@ def example_basic_collection():
     
     # Display results
     for i, post in enumerate(posts, 1):
-        print(f"\n{i}. {post['title']}")
-        print(f"   Score: {post['score']} | Comments: {post['num_comments']}")
-        print(f"   URL: {post['permalink']}")
+        print(f"\n{i}. {post.title}")
+        print(f"   Score: {post.score} | Comments: {post.num_comments}")
+        print(f"   URL: {post.permalink}")
+    
+    # Archive the posts for later analysis
+    collector.save_posts(posts, 'python_hot.json.gz')
 
 
 def example_engagement_analysis():
@@ -463,13 +1450,14 @@ def example_engagement_analysis():
     
     posts = collector.collect_posts('technology', limit=20, sort_by='hot')
     analyzer = EngagementAnalyzer()
+    now = time.time()
     
     print("\nTop Posts by Engagement Velocity:")
     for post in posts[:5]:
-        velocity = analyzer.calculate_engagement_velocity(post)
+        velocity = analyzer.calculate_engagement_velocity(post, now)
         quality = analyzer.calculate_engagement_quality(post)
         
-        print(f"\n- {post['title'][:60]}...")
+        print(f"\n- {post.title[:60]}...")
         print(f"  Score/hour: {velocity['score_per_hour']:.2f}")
         print(f"  Comments/hour: {velocity['comments_per_hour']:.2f}")
         print(f"  Quality score: {quality:.2f}")
@@ -487,18 +1475,46 @@ def example_sentiment_analysis():
         user_agent="RedditResearch/1.0 by /u/yourusername"
     )
     
-    posts = collector.collect_posts('technology', limit=10)
+    subreddits = ['technology', 'programming', 'science']
     sentiment_analyzer = SentimentAnalyzer()
     
-    print("\nPost Sentiment Analysis:")
-    for post in posts[:5]:
-        text_sentiment = sentiment_analyzer.analyze_post(post)
-        engagement_sentiment = sentiment_analyzer.analyze_engagement_sentiment(post)
+    # Fetching is I/O-bound and VADER is CPU-bound: a thread fetches the next
+    # subreddit while worker processes score the posts already fetched.
+    # Workers are spawned rather than forked, since forking while the fetch
+    # thread holds locks can deadlock the child. Each worker receives the
+    # analyzer once, through the pool initializer, and scores one slice of
+    # texts per task.
+    workers = os.cpu_count() or 1
+    spawn = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn,
+                             initializer=_init_sentiment_worker,
+                             initargs=(sentiment_analyzer,)) as cpu_pool, \
+            ThreadPoolExecutor(max_workers=1) as io_pool:
+        fetches = [
+            io_pool.submit(collector.collect_posts, subreddit, limit=10)
+            for subreddit in subreddits
+        ]
         
-        print(f"\n- {post['title'][:60]}...")
-        print(f"  Text sentiment: {text_sentiment['classification']} (compound: {text_sentiment['compound']:.2f})")
-        print(f"  Engagement sentiment: {engagement_sentiment['engagement_sentiment']}")
-        print(f"  Controversy: {engagement_sentiment['controversy_level']}")
+        for subreddit, fetch in zip(subreddits, fetches):
+            posts = fetch.result()[:5]
+            texts = [SentimentAnalyzer.post_text(post) for post in posts]
+            # Split each batch evenly across the workers, one slice per task
+            size = max(1, -(-len(texts) // workers))
+            slices = [texts[i:i + size] for i in range(0, len(texts), size)]
+            text_sentiments = [
+                result
+                for results in cpu_pool.map(_analyze_texts_in_worker, slices)
+                for result in results
+            ]
+            
+            print(f"\nPost Sentiment Analysis for r/{subreddit}:")
+            for post, text_sentiment in zip(posts, text_sentiments):
+                engagement_sentiment = sentiment_analyzer.analyze_engagement_sentiment(post)
+                
+                print(f"\n- {post.title[:60]}...")
+                print(f"  Text sentiment: {text_sentiment['classification']} (compound: {text_sentiment['compound']:.2f})")
+                print(f"  Engagement sentiment: {engagement_sentiment['engagement_sentiment']}")
+                print(f"  Controversy: {engagement_sentiment['controversy_level']}")
 
 
 def example_topic_extraction():
@@ -534,17 +1550,19 @@ def example_multi_subreddit_analysis():
     print("EXAMPLE 5: Multi-Subreddit Analysis")
     print("="*80)
     
-    collector = RedditDataCollector(
+    subreddits = ['python', 'javascript', 'programming']
+    
+    with RedditDataCollector(
         client_id="YOUR_CLIENT_ID",
         client_secret="YOUR_CLIENT_SECRET",
         user_agent="RedditResearch/1.0 by /u/yourusername"
-    )
-    
-    subreddits = ['python', 'javascript', 'programming']
+    ) as collector:
+        # Fetch all subreddits concurrently behind the collector's shared rate limiter
+        infos = collector.get_subreddit_info_many(subreddits)
     
     print("\nSubreddit Statistics:")
     for subreddit_name in subreddits:
-        info = collector.get_subreddit_info(subreddit_name)
+        info = infos[subreddit_name]
         if info:
             print(f"\nr/{info['name']}")
             print(f"  Subscribers: {info['subscribers']:,}")
@@ -552,6 +1570,29 @@ def example_multi_subreddit_analysis():
             print(f"  Activity rate: {info['activity_rate']:.4f}")
 
 
+def example_async_collection():
+    """Example: Collect several subreddits concurrently with Async PRAW"""
+    print("\n" + "="*80)
+    print("EXAMPLE 6: Async Multi-Subreddit Collection")
+    print("="*80)
+    
+    async def collect():
+        async with AsyncRedditDataCollector(
+            client_id="YOUR_CLIENT_ID",
+            client_secret="YOUR_CLIENT_SECRET",
+            user_agent="RedditResearch/1.0 by /u/yourusername"
+        ) as collector:
+            subreddits = ['python', 'javascript', 'programming', 'rust', 'golang',
+                          'java', 'cpp', 'csharp', 'ruby', 'webdev']
+            return await collector.collect_many(subreddits, limit=10)
+    
+    results = asyncio.run(collect())
+    
+    print("\nPosts collected per subreddit:")
+    for subreddit_name, posts in results.items():
+        print(f"  r/{subreddit_name}: {len(posts)}")
+
+
 if __name__ == '__main__':
     print("\n" + "="*80)
     print("Reddit Data Collection Examples")
@@ -566,3 +1607,4 @@ if __name__ == '__main__':
     # example_sentiment_analysis()
     # example_topic_extraction()
     # example_multi_subreddit_analysis()
+    # example_async_collection()
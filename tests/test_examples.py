@@ -0,0 +1,662 @@
+"""Tests for the collection and analysis helpers in examples.py."""
+
+import gzip
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from itertools import islice
+from types import SimpleNamespace
+
+import pytest
+
+import examples
+from examples import (
+    RateLimiter, ResponseCache, PartialFetchError, cached, RedditPost, RedditDataCollector,
+    EngagementAnalyzer, SentimentAnalyzer, TopicExtractor,
+)
+
+
+def make_post(**overrides):
+    """Build a RedditPost with realistic defaults."""
+    data = {
+        'id': 'abc123',
+        'title': 'Test Post',
+        'selftext': '',
+        'url': 'https://example.com',
+        'permalink': 'https://reddit.com/r/python/comments/abc123/',
+        'score': 100,
+        'upvote_ratio': 0.9,
+        'num_comments': 10,
+        'created_utc': 1700000000.0,
+        'subreddit': 'python',
+        'author': 'someone',
+        'flair': None,
+        'gilded': 0,
+        'stickied': False,
+        'over_18': False,
+        'is_self': False,
+        'domain': 'example.com',
+    }
+    data.update(overrides)
+    return RedditPost(**data)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temporary directory."""
+    return ResponseCache(str(tmp_path))
+
+
+class FakeCollector:
+    """Minimal stand-in exposing the attributes the cached decorator uses."""
+    
+    def __init__(self, cache, results):
+        self.cache = cache
+        self.results = results
+        self.fail = False
+        self.calls = 0
+    
+    @cached(ttl=300)
+    def fetch(self, name, limit=10):
+        self.calls += 1
+        if self.fail:
+            raise PartialFetchError('connection reset', self.results)
+        return self.results
+    
+    @cached(ttl=300, encode=examples._posts_to_dicts, decode=examples._posts_from_dicts)
+    def fetch_posts(self, name):
+        self.calls += 1
+        return self.results
+
+
+class TestRateLimiter:
+    """Tests for the token bucket rate limiter."""
+    
+    def test_burst_within_capacity_does_not_wait(self):
+        """Test that up to max_requests calls go through immediately."""
+        limiter = RateLimiter(max_requests=3, time_window=60)
+        
+        assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    
+    def test_waits_grow_beyond_capacity(self):
+        """Test that callers past the capacity wait for their share of the refill."""
+        limiter = RateLimiter(max_requests=2, time_window=1)
+        limiter._reserve()
+        limiter._reserve()
+        
+        first_wait = limiter._reserve()
+        second_wait = limiter._reserve()
+        
+        assert first_wait == pytest.approx(0.5, abs=0.05)
+        assert second_wait == pytest.approx(1.0, abs=0.05)
+    
+    def test_disabled_limiter_never_waits(self):
+        """Test that a disabled limiter hands out no waits."""
+        limiter = RateLimiter(max_requests=1, time_window=60, enabled=False)
+        
+        assert [limiter._reserve() for _ in range(5)] == [0.0] * 5
+
+
+class TestResponseCache:
+    """Tests for the SQLite-backed response cache."""
+    
+    def test_set_and_get(self, cache):
+        """Test that a stored value is returned while fresh."""
+        cache.set('key', {'value': 1})
+        
+        assert cache.get('key', ttl=60) == {'value': 1}
+    
+    def test_missing_key(self, cache):
+        """Test that unknown keys are misses."""
+        assert cache.get('missing', ttl=60) is None
+    
+    def test_ttl_expiry(self, cache, monkeypatch):
+        """Test that entries older than the TTL are misses."""
+        cache.set('key', 'value')
+        now = examples.time.time()
+        monkeypatch.setattr(examples.time, 'time', lambda: now + 61)
+        
+        assert cache.get('key', ttl=60) is None
+        assert cache.get('key', ttl=120) == 'value'
+    
+    def test_other_praw_version_is_miss(self, cache, monkeypatch):
+        """Test that entries written by another PRAW version are ignored."""
+        cache.set('key', 'value')
+        monkeypatch.setattr(examples.praw, '__version__', '0.0.0')
+        
+        assert cache.get('key', ttl=60) is None
+    
+    def test_unreadable_entry_is_miss(self, cache):
+        """Test that an entry that fails to unpickle is treated as a miss."""
+        cache.set('key', 'value')
+        with closing(sqlite3.connect(cache.path)) as conn, conn:
+            conn.execute("UPDATE cache SET value = ? WHERE key = 'key'", (b'not a pickle',))
+        
+        assert cache.get('key', ttl=60) is None
+    
+    def test_connections_are_closed(self, cache, monkeypatch):
+        """Test that every connection opened by the cache is closed again."""
+        opened = []
+        connect = sqlite3.connect
+        
+        def tracking_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            opened.append(conn)
+            return conn
+        
+        monkeypatch.setattr(examples.sqlite3, 'connect', tracking_connect)
+        cache.set('key', 'value')
+        cache.get('key', ttl=60)
+        cache.clear()
+        
+        assert len(opened) == 3
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+    
+    def test_clear(self, cache):
+        """Test that clear removes every entry."""
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.clear()
+        
+        assert cache.get('a', ttl=60) is None
+        assert cache.get('b', ttl=60) is None
+
+
+class TestCachedDecorator:
+    """Tests for the cached method decorator."""
+    
+    def test_second_call_is_served_from_cache(self, cache):
+        """Test that repeated calls with the same arguments hit the cache."""
+        collector = FakeCollector(cache, ['result'])
+        
+        assert collector.fetch('python') == ['result']
+        assert collector.fetch('python', limit=10) == ['result']
+        assert collector.calls == 1
+    
+    def test_different_arguments_are_cached_separately(self, cache):
+        """Test that the cache key includes the bound arguments."""
+        collector = FakeCollector(cache, ['result'])
+        collector.fetch('python')
+        collector.fetch('python', limit=20)
+        collector.fetch('rust')
+        
+        assert collector.calls == 3
+    
+    def test_force_refresh_bypasses_cache(self, cache):
+        """Test that force_refresh refetches and stores the new result."""
+        collector = FakeCollector(cache, ['old'])
+        collector.fetch('python')
+        collector.results = ['new']
+        
+        assert collector.fetch('python', force_refresh=True) == ['new']
+        assert collector.fetch('python') == ['new']
+        assert collector.calls == 2
+    
+    def test_empty_results_are_not_cached(self, cache):
+        """Test that empty results, returned on errors, are refetched."""
+        collector = FakeCollector(cache, [])
+        collector.fetch('python')
+        collector.fetch('python')
+        
+        assert collector.calls == 2
+    
+    def test_partial_results_are_not_cached(self, cache):
+        """Test that results of a failed fetch are returned but not stored."""
+        collector = FakeCollector(cache, ['partial'])
+        collector.fail = True
+        
+        assert collector.fetch('python') == ['partial']
+        
+        collector.fail = False
+        collector.results = ['complete']
+        assert collector.fetch('python') == ['complete']
+        assert collector.calls == 2
+    
+    def test_no_cache_calls_through(self):
+        """Test that a collector without a cache always calls the method."""
+        collector = FakeCollector(None, ['result'])
+        collector.fetch('python')
+        collector.fetch('python')
+        
+        assert collector.calls == 2
+    
+    def test_posts_are_cached_as_plain_data(self, cache):
+        """Test that posts are stored without pickling RedditPost itself."""
+        post = make_post()
+        collector = FakeCollector(cache, [post])
+        collector.fetch_posts('python')
+        
+        with closing(sqlite3.connect(cache.path)) as conn:
+            (value,) = conn.execute("SELECT value FROM cache").fetchone()
+        
+        assert b'RedditPost' not in value
+        assert collector.fetch_posts('python') == [post]
+        assert collector.calls == 1
+
+
+class TestRedditPost:
+    """Tests for the RedditPost record."""
+    
+    def test_dict_style_access(self):
+        """Test item access and get for code written against post dicts."""
+        post = make_post(flair='Discussion')
+        
+        assert post['title'] == 'Test Post'
+        assert post.get('flair') == 'Discussion'
+        assert post.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            post['missing']
+    
+    def test_slots_match_fields(self):
+        """Test that posts are slotted, with one slot per field."""
+        post = make_post()
+        
+        assert not hasattr(post, '__dict__')
+        assert RedditPost.__slots__ == tuple(RedditPost.__dataclass_fields__)
+    
+    def test_from_dict_round_trip(self):
+        """Test that from_dict accepts to_dict output, extra keys included."""
+        post = make_post()
+        data = post.to_dict()
+        
+        assert 'created_datetime' in data
+        assert RedditPost.from_dict(data) == post
+
+
+class TestEngagementAnalyzer:
+    """Tests for the vectorized engagement metrics."""
+    
+    NOW = 1700036000.0
+    
+    @pytest.fixture
+    def posts(self):
+        """Posts covering the clamped and capped branches of the formulas."""
+        return [
+            make_post(id='a', score=100, num_comments=10, upvote_ratio=0.9),
+            make_post(id='b', score=0, num_comments=3, upvote_ratio=0.5),
+            make_post(id='c', score=-5, num_comments=0, upvote_ratio=0.1),
+            make_post(id='d', score=2, num_comments=50, upvote_ratio=1.0),
+            make_post(id='e', created_utc=self.NOW + 60),
+            make_post(id='f', created_utc=self.NOW),
+        ]
+    
+    def test_calculate_batch_matches_scalar_methods(self, posts):
+        """Test that each row equals the per-post velocity and quality."""
+        frame = EngagementAnalyzer.calculate_batch(posts, now=self.NOW)
+        
+        assert len(frame) == len(posts)
+        for row, post in zip(frame.to_dict('records'), posts):
+            velocity = EngagementAnalyzer.calculate_engagement_velocity(post, now=self.NOW)
+            quality = EngagementAnalyzer.calculate_engagement_quality(post)
+            
+            assert row == pytest.approx({**velocity, 'quality_score': quality})
+    
+    def test_calculate_quality_batch_matches_scalar_method(self, posts):
+        """Test that the quality array equals the per-post quality scores."""
+        qualities = EngagementAnalyzer.calculate_quality_batch(posts)
+        
+        assert list(qualities) == pytest.approx(
+            [EngagementAnalyzer.calculate_engagement_quality(post) for post in posts]
+        )
+    
+    def test_calculate_batch_empty(self):
+        """Test that no posts give an empty frame with the metric columns."""
+        frame = EngagementAnalyzer.calculate_batch([], now=self.NOW)
+        
+        assert frame.empty
+        assert list(frame.columns) == [
+            'age_hours', 'score_per_hour', 'comments_per_hour', 'quality_score'
+        ]
+
+
+class FakeVader:
+    """Stand-in for VADER that scores by text and records its calls."""
+    
+    SCORES = {
+        'great': {'compound': 0.6, 'pos': 0.7, 'neu': 0.3, 'neg': 0.0},
+        'awful': {'compound': -0.5, 'pos': 0.0, 'neu': 0.4, 'neg': 0.6},
+        'fine': {'compound': 0.0, 'pos': 0.0, 'neu': 1.0, 'neg': 0.0},
+    }
+    
+    def __init__(self):
+        self.calls = []
+    
+    def polarity_scores(self, text):
+        self.calls.append(text)
+        return self.SCORES[text]
+
+
+class TestSentimentAnalyzer:
+    """Tests for batched sentiment analysis."""
+    
+    TEXTS = ['great', 'awful', '', 'great', 'fine', 'awful', 'great']
+    
+    def test_analyze_texts_scores_each_text_once(self):
+        """Test that duplicates are scored once and results keep input order."""
+        vader = FakeVader()
+        analyzer = SentimentAnalyzer(cache_size=0)
+        analyzer.__dict__['vader'] = vader
+        
+        results = analyzer.analyze_texts(self.TEXTS)
+        
+        assert vader.calls == ['great', 'awful', 'fine']
+        assert [r['classification'] for r in results] == [
+            'positive', 'negative', 'neutral', 'positive', 'neutral', 'negative', 'positive'
+        ]
+        assert results == [analyzer.analyze_text(text) for text in self.TEXTS]
+    
+    def test_analyze_texts_results_are_independent(self):
+        """Test that results for duplicate texts are separate dictionaries."""
+        analyzer = SentimentAnalyzer()
+        analyzer.__dict__['vader'] = FakeVader()
+        
+        results = analyzer.analyze_texts(['great', 'great'])
+        results[0]['compound'] = 1.0
+        
+        assert results[1]['compound'] == 0.6
+    
+    def test_analyze_texts_onnx_batches_unique_texts(self):
+        """Test that the onnx backend gets each distinct text once, in first-seen order."""
+        batches = []
+        
+        def pipe(texts, batch_size, truncation):
+            batches.append((texts, batch_size))
+            return [
+                {'label': 'NEGATIVE' if text == 'awful' else 'POSITIVE', 'score': 0.9}
+                for text in texts
+            ]
+        
+        analyzer = SentimentAnalyzer(backend='onnx')
+        analyzer.__dict__['_onnx_pipeline'] = pipe
+        
+        results = analyzer.analyze_texts(self.TEXTS, batch_size=8)
+        
+        assert batches == [(['great', 'awful', 'fine'], 8)]
+        assert [r['compound'] for r in results] == pytest.approx(
+            [0.9, -0.9, 0.0, 0.9, 0.9, -0.9, 0.9]
+        )
+        assert results[2] == SentimentAnalyzer.NEUTRAL_RESULT
+    
+    def test_worker_reuses_initialized_analyzer(self, monkeypatch):
+        """Test that every task in a worker uses the analyzer set by the initializer."""
+        monkeypatch.setattr(examples, '_worker_analyzer', None)
+        vader = FakeVader()
+        analyzer = SentimentAnalyzer(cache_size=0)
+        analyzer.__dict__['vader'] = vader
+        
+        examples._init_sentiment_worker(analyzer)
+        first = examples._analyze_texts_in_worker(['great', 'awful'])
+        second = examples._analyze_texts_in_worker(['fine'])
+        
+        assert examples._worker_analyzer is analyzer
+        assert first + second == analyzer.analyze_texts(['great', 'awful', 'fine'])
+        assert vader.calls[:3] == ['great', 'awful', 'fine']
+
+
+class TestTopicExtractor:
+    """Tests for keyword and ranking helpers."""
+    
+    def test_extract_keywords(self):
+        """Test keyword counts, stop word removal and ordering."""
+        posts = [
+            make_post(title='The Python release is out'),
+            make_post(title='Python and Rust compared'),
+            make_post(title='Rust for Python developers'),
+        ]
+        
+        keywords = TopicExtractor.extract_keywords(posts, top_n=2)
+        
+        assert keywords == [('python', 3), ('rust', 2)]
+    
+    def test_extract_keywords_min_count(self):
+        """Test that min_count drops rare words."""
+        posts = [
+            make_post(title='python rust'),
+            make_post(title='python golang'),
+        ]
+        
+        keywords = TopicExtractor.extract_keywords(posts, top_n=10, min_count=2)
+        
+        assert keywords == [('python', 2)]
+    
+    def test_get_top_posts_by_engagement(self):
+        """Test ranking by quality score, best first."""
+        posts = [
+            make_post(id=str(i), score=100, num_comments=(i * 7) % 20, upvote_ratio=0.5)
+            for i in range(20)
+        ]
+        expected = sorted(
+            posts, key=EngagementAnalyzer.calculate_engagement_quality, reverse=True
+        )[:3]
+        
+        top = TopicExtractor.get_top_posts_by_engagement(posts, top_n=3)
+        
+        assert [post for post, _ in top] == expected
+        assert [quality for _, quality in top] == [
+            pytest.approx(EngagementAnalyzer.calculate_engagement_quality(post))
+            for post in expected
+        ]
+    
+    def test_get_top_posts_by_engagement_small_input(self):
+        """Test top_n larger than the input and empty input."""
+        posts = [make_post(id='a'), make_post(id='b')]
+        
+        assert len(TopicExtractor.get_top_posts_by_engagement(posts, top_n=10)) == 2
+        assert TopicExtractor.get_top_posts_by_engagement([], top_n=10) == []
+
+
+class TestSavePosts:
+    """Tests for RedditDataCollector.save_posts."""
+    
+    def test_save_json(self, tmp_path):
+        """Test writing an uncompressed JSON array."""
+        posts = [make_post(id='a'), make_post(id='b')]
+        
+        path = RedditDataCollector.save_posts(posts, tmp_path / 'posts.json')
+        
+        loaded = json.loads(path.read_text())
+        assert [RedditPost.from_dict(data) for data in loaded] == posts
+    
+    def test_save_gzip(self, tmp_path):
+        """Test that .gz paths are written compressed."""
+        posts = [make_post(id='a')]
+        
+        path = RedditDataCollector.save_posts(posts, tmp_path / 'posts.json.gz')
+        
+        with gzip.open(path, 'rt') as f:
+            assert [RedditPost.from_dict(data) for data in json.load(f)] == posts
+    
+    def test_save_without_orjson(self, tmp_path, monkeypatch):
+        """Test the standard library json fallback."""
+        monkeypatch.setattr(examples, 'orjson', None)
+        posts = [make_post(id='a')]
+        
+        path = RedditDataCollector.save_posts(posts, tmp_path / 'posts.json')
+        
+        assert [RedditPost.from_dict(data) for data in json.loads(path.read_text())] == posts
+
+
+class TestMapConcurrently:
+    """Tests for the collector's long-lived worker pool."""
+    
+    @pytest.fixture
+    def collector(self):
+        """Create a collector without a response cache, closed afterwards."""
+        with RedditDataCollector('id', 'secret', 'test-agent', cache_dir=None,
+                                 max_workers=4) as collector:
+            yield collector
+    
+    def test_worker_clients_are_reused_across_calls(self, collector):
+        """Test that later calls run on the same threads and PRAW clients."""
+        collector.max_workers = 1
+        
+        first = collector._map_concurrently(lambda item: collector.reddit, ['a'], 10)
+        second = collector._map_concurrently(lambda item: collector.reddit, ['b'], 10)
+        
+        assert first['a'] is second['b']
+        assert first['a'] is not collector.reddit
+    
+    def test_max_workers_caps_concurrency(self, collector):
+        """Test that a call runs at most max_workers items at once."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+        
+        def work(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(item)
+            return item.upper()
+        
+        results = collector._map_concurrently(work, ['a', 'b', 'c', 'd'], 2)
+        
+        assert results == {'a': 'A', 'b': 'B', 'c': 'C', 'd': 'D'}
+        assert max(peak) == 2
+    
+    def test_close_shuts_down_pool(self, collector):
+        """Test that close stops the pool and a later call starts a new one."""
+        collector._map_concurrently(str.upper, ['a'], 1)
+        executor = collector._executor
+        
+        collector.close()
+        
+        assert collector._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(str.upper, 'a')
+        assert collector._map_concurrently(str.upper, ['b'], 1) == {'b': 'B'}
+
+
+class FakeRedditor:
+    """Author whose string form is the username, like praw.models.Redditor."""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __str__(self):
+        return self.name
+
+
+def make_submission(**overrides):
+    """Build a PRAW-like submission with the attributes _extract_post_data reads."""
+    data = {
+        'id': 'abc123',
+        'title': 'Test Post',
+        'selftext': 'Body text',
+        'url': 'https://example.com/article',
+        'permalink': '/r/python/comments/abc123/test_post/',
+        'score': 100,
+        'upvote_ratio': 0.9,
+        'num_comments': 10,
+        'created_utc': 1700000000.0,
+        'subreddit': SimpleNamespace(display_name='python'),
+        'author': FakeRedditor('someone'),
+        'link_flair_text': 'Discussion',
+        'gilded': 1,
+        'stickied': False,
+        'over_18': False,
+        'is_self': False,
+        'domain': 'example.com',
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+class TestExtractPostData:
+    """Tests for converting submissions into RedditPost records."""
+    
+    def test_fields_are_mapped(self):
+        """Test that each submission attribute lands in the matching field."""
+        submission = make_submission()
+        
+        post = RedditDataCollector._extract_post_data(submission)
+        
+        assert post == make_post(
+            selftext='',
+            url='https://example.com/article',
+            permalink='https://reddit.com/r/python/comments/abc123/test_post/',
+            author='someone',
+            flair='Discussion',
+            gilded=1,
+        )
+    
+    def test_self_post_keeps_selftext(self):
+        """Test that selftext is kept for self posts only."""
+        submission = make_submission(is_self=True)
+        
+        assert RedditDataCollector._extract_post_data(submission).selftext == 'Body text'
+    
+    def test_deleted_author_and_missing_flair(self):
+        """Test placeholders for a deleted author and a post without flair."""
+        submission = make_submission(author=None, link_flair_text=None)
+        
+        post = RedditDataCollector._extract_post_data(submission)
+        
+        assert post.author == '[deleted]'
+        assert post.flair is None
+    
+    def test_repeated_fields_are_interned(self):
+        """Test that equal subreddit, author, flair and domain values share one object."""
+        def fresh(text):
+            # Build the string at runtime so it is a distinct, non-interned object
+            return ''.join(list(text))
+        
+        posts = [
+            RedditDataCollector._extract_post_data(make_submission(
+                id=str(i),
+                subreddit=SimpleNamespace(display_name=fresh('python')),
+                author=FakeRedditor(fresh('someone')),
+                link_flair_text=fresh('Discussion'),
+                domain=fresh('example.com'),
+            ))
+            for i in range(2)
+        ]
+        
+        for field in ('subreddit', 'author', 'flair', 'domain'):
+            assert getattr(posts[0], field) is getattr(posts[1], field), field
+
+
+class FakeComment:
+    """Comment with a name and nested replies, as walked by _walk_comments."""
+    
+    def __init__(self, name, replies=()):
+        self.name = name
+        self.replies = list(replies)
+
+
+class TestWalkComments:
+    """Tests for breadth-first comment traversal."""
+    
+    def test_breadth_first_order(self):
+        """Test that comments come out in CommentForest.list() order."""
+        forest = [
+            FakeComment('a', [FakeComment('a1', [FakeComment('a1x')]), FakeComment('a2')]),
+            FakeComment('b', [FakeComment('b1')]),
+        ]
+        
+        names = [comment.name for comment in RedditDataCollector._walk_comments(forest)]
+        
+        assert names == ['a', 'b', 'a1', 'a2', 'b1', 'a1x']
+    
+    def test_stops_early(self):
+        """Test that taking a prefix does not visit deeper replies."""
+        class Unvisited(FakeComment):
+            @property
+            def replies(self):
+                raise AssertionError('replies of an unvisited comment were read')
+            
+            @replies.setter
+            def replies(self, value):
+                pass
+        
+        forest = [FakeComment('a', [Unvisited('a1')]), FakeComment('b')]
+        
+        names = [c.name for c in islice(RedditDataCollector._walk_comments(forest), 2)]
+        
+        assert names == ['a', 'b']
@@ -5,6 +5,8 @@ import tempfile
 import os
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.exc import IntegrityError
 from mod.Model import RedditSource, DBContext
 
 
@@ -127,6 +129,32 @@ class TestDBContextCRUD:
         
         assert duplicate is None
     
+    def test_create_many(self, temp_db_context):
+        """Test creating several records in one call."""
+        records = temp_db_context.create_many([
+            {'source': 'reddit', 'source_id': 'many_1', 'title': 'First',
+             'score_dictionary': {'upvotes': 1}},
+            {'source': 'reddit', 'source_id': 'many_2', 'title': 'Second'},
+        ])
+        
+        assert [record.source_id for record in records] == ['many_1', 'many_2']
+        assert all(record.id is not None for record in records)
+        assert records[0].get_score_dict() == {'upvotes': 1}
+        assert records[1].processed is False
+        assert temp_db_context.count() == 2
+    
+    def test_create_many_duplicate(self, temp_db_context):
+        """Test that a duplicate aborts the whole batch."""
+        temp_db_context.create(source='reddit', source_id='many_dup', title='Existing')
+        
+        with pytest.raises(IntegrityError):
+            temp_db_context.create_many([
+                {'source': 'reddit', 'source_id': 'many_new', 'title': 'New'},
+                {'source': 'reddit', 'source_id': 'many_dup', 'title': 'Duplicate'},
+            ])
+        
+        assert temp_db_context.count() == 1
+    
     def test_read(self, temp_db_context):
         """Test read operation."""
         created = temp_db_context.create(
@@ -141,6 +169,20 @@ class TestDBContextCRUD:
         assert retrieved.id == created.id
         assert retrieved.title == 'Read Test'
     
+    def test_create_timestamps_match_read(self, temp_db_context):
+        """Test that create returns the same naive UTC timestamps read returns."""
+        created = temp_db_context.create(
+            source='reddit',
+            source_id='timestamps',
+            title='Timestamps'
+        )
+        retrieved = temp_db_context.read('reddit', 'timestamps')
+        
+        assert created.created_at.tzinfo is None
+        assert created.created_at == retrieved.created_at
+        assert created.updated_at == retrieved.updated_at
+        assert created.to_dict()['created_at'] == retrieved.to_dict()['created_at']
+    
     def test_read_nonexistent(self, temp_db_context):
         """Test reading non-existent record."""
         record = temp_db_context.read('reddit', 'nonexistent')
@@ -179,6 +221,10 @@ class TestDBContextCRUD:
         assert updated is not None
         assert updated.title == 'Updated Title'
         assert updated.score == 75.0
+        assert isinstance(updated.updated_at, datetime)
+        assert updated.updated_at.tzinfo is None
+        assert updated.created_at.tzinfo is None
+        assert updated.updated_at >= updated.created_at
     
     def test_update_nonexistent(self, temp_db_context):
         """Test updating non-existent record."""
@@ -190,6 +236,55 @@ class TestDBContextCRUD:
         
         assert result is None
     
+    def test_update_without_returning_object(self, temp_db_context):
+        """Test update with return_obj=False issues a direct UPDATE."""
+        temp_db_context.create(
+            source='reddit',
+            source_id='update_direct',
+            title='Original Title'
+        )
+        
+        assert temp_db_context.update(
+            source='reddit',
+            source_id='update_direct',
+            processed=True,
+            score_dictionary={'upvotes': 3},
+            return_obj=False
+        ) is True
+        assert temp_db_context.update(
+            source='reddit',
+            source_id='nonexistent',
+            processed=True,
+            return_obj=False
+        ) is False
+        
+        record = temp_db_context.read('reddit', 'update_direct')
+        assert record.processed is True
+        assert record.title == 'Original Title'
+        assert record.get_score_dict() == {'upvotes': 3}
+    
+    def test_update_without_fields_changes_nothing(self, temp_db_context):
+        """Test update with return_obj=False and no fields leaves the record alone."""
+        created = temp_db_context.create(
+            source='reddit',
+            source_id='update_empty',
+            title='Original Title'
+        )
+        
+        assert temp_db_context.update(
+            source='reddit',
+            source_id='update_empty',
+            return_obj=False
+        ) is False
+        
+        record = temp_db_context.read('reddit', 'update_empty')
+        assert record.updated_at == created.updated_at
+    
+    def test_update_fields_rejects_unknown_columns(self, temp_db_context):
+        """Test update_fields refuses columns outside the whitelist."""
+        with pytest.raises(ValueError):
+            temp_db_context.update_fields('reddit', 'any', created_at=None)
+    
     def test_upsert_create(self, temp_db_context):
         """Test upsert creating a new record."""
         record = temp_db_context.upsert(
@@ -225,6 +320,104 @@ class TestDBContextCRUD:
         count = temp_db_context.count()
         assert count == 1
     
+    def test_upsert_keeps_unset_fields(self, temp_db_context):
+        """Test upsert leaves stored values alone for fields passed as None."""
+        temp_db_context.create(
+            source='reddit',
+            source_id='upsert_partial',
+            title='Original',
+            description='Keep me',
+            score=50.0
+        )
+        
+        updated = temp_db_context.upsert(
+            source='reddit',
+            source_id='upsert_partial',
+            title='Updated'
+        )
+        
+        assert updated.title == 'Updated'
+        assert updated.description == 'Keep me'
+        assert updated.score == 50.0
+    
+    def test_bulk_upsert(self, temp_db_context):
+        """Test bulk upsert inserting new and updating existing records."""
+        temp_db_context.create(
+            source='reddit',
+            source_id='bulk_existing',
+            title='Original',
+            score=10.0
+        )
+        
+        records = temp_db_context.bulk_upsert([
+            {'source': 'reddit', 'source_id': 'bulk_existing', 'title': 'Updated',
+             'score': 20.0, 'score_dictionary': {'upvotes': 5}},
+            {'source': 'reddit', 'source_id': 'bulk_new', 'title': 'New'},
+        ])
+        
+        assert len(records) == 2
+        assert temp_db_context.count() == 2
+        
+        existing = temp_db_context.read('reddit', 'bulk_existing')
+        assert existing.title == 'Updated'
+        assert existing.score == 20.0
+        assert existing.get_score_dict() == {'upvotes': 5}
+        assert existing.processed is False
+    
+    def test_bulk_upsert_chunks(self, temp_db_context):
+        """Test bulk upsert with more rows than a single chunk."""
+        records = temp_db_context.bulk_upsert([
+            {'source': 'reddit', 'source_id': f'chunk_{i}', 'title': f'Post {i}'}
+            for i in range(1200)
+        ])
+        
+        assert len(records) == 1200
+        assert temp_db_context.count() == 1200
+    
+    def test_bulk_upsert_duplicate_keys(self, temp_db_context):
+        """Test that a key repeated within one batch is merged, last value winning."""
+        records = temp_db_context.bulk_upsert([
+            {'source': 'reddit', 'source_id': 'dup', 'title': 'x', 'description': 'Keep me'},
+            {'source': 'reddit', 'source_id': 'other', 'title': 'Other'},
+            {'source': 'reddit', 'source_id': 'dup', 'title': 'y'},
+        ])
+        
+        assert [record.source_id for record in records] == ['dup', 'other']
+        assert records[0].title == 'y'
+        assert records[0].description == 'Keep me'
+        
+        stored = temp_db_context.read('reddit', 'dup')
+        assert stored.title == 'y'
+        assert stored.description == 'Keep me'
+    
+    def test_fast_bulk_insert(self, temp_db_context):
+        """Test raw executemany ingest inserts and updates rows."""
+        existing = temp_db_context.create(
+            source='reddit',
+            source_id='fast_existing',
+            title='Original',
+            description='Keep me'
+        )
+        
+        written = temp_db_context.fast_bulk_insert(
+            {'source': 'reddit', 'source_id': source_id, 'title': 'Fast',
+             'score': 5.0, 'score_dictionary': {'upvotes': 2}}
+            for source_id in ('fast_existing', 'fast_new')
+        )
+        
+        assert written == 2
+        assert temp_db_context.count() == 2
+        
+        updated = temp_db_context.read('reddit', 'fast_existing')
+        assert updated.id == existing.id
+        assert updated.title == 'Fast'
+        assert updated.description == 'Keep me'
+        
+        new = temp_db_context.read('reddit', 'fast_new')
+        assert new.processed is False
+        assert new.created_at is not None
+        assert new.get_score_dict() == {'upvotes': 2}
+    
     def test_delete(self, temp_db_context):
         """Test delete operation."""
         temp_db_context.create(
@@ -285,6 +478,36 @@ class TestDBContextCRUD:
         assert records[1].score == 80.0
         assert records[2].score == 90.0
     
+    def test_list_all_unknown_order_by(self, temp_db_context):
+        """Test that non-column order_by values fall back to score."""
+        temp_db_context.create(source='reddit', source_id='1', title='Post 1', score=70.0)
+        temp_db_context.create(source='reddit', source_id='2', title='Post 2', score=90.0)
+        
+        records = temp_db_context.list_all(order_by='to_dict')
+        
+        assert [record.score for record in records] == [90.0, 70.0]
+    
+    def test_list_all_rows(self, temp_db_context):
+        """Test listing records as plain dictionaries."""
+        temp_db_context.create(source='reddit', source_id='1', title='Post 1', score=90.0)
+        temp_db_context.create(source='reddit', source_id='2', title='Post 2', score=70.0)
+        
+        rows = temp_db_context.list_all_rows(limit=1)
+        
+        assert len(rows) == 1
+        assert isinstance(rows[0], dict)
+        assert rows[0]['source_id'] == '1'
+        assert rows[0]['score'] == 90.0
+    
+    def test_iter_all(self, temp_db_context):
+        """Test streaming records in order."""
+        temp_db_context.create(source='reddit', source_id='1', title='Post 1', score=90.0)
+        temp_db_context.create(source='reddit', source_id='2', title='Post 2', score=70.0)
+        
+        scores = [record.score for record in temp_db_context.iter_all(ascending=True)]
+        
+        assert scores == [70.0, 90.0]
+    
     def test_count(self, temp_db_context):
         """Test count operation."""
         assert temp_db_context.count() == 0
@@ -339,6 +562,85 @@ class TestDBContextCRUD:
                 os.unlink(db_path)
 
 
+class TestSQLitePragmas:
+    """Tests for SQLite connection configuration."""
+    
+    def test_wal_mode_enabled(self, temp_db_context):
+        """Test that connections use WAL journaling and NORMAL sync."""
+        with temp_db_context.engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+            synchronous = conn.exec_driver_sql('PRAGMA synchronous').scalar()
+        
+        assert journal_mode == 'wal'
+        assert synchronous == 1  # NORMAL
+    
+    def test_checkpoint_truncates_wal(self, temp_db_context):
+        """Test that checkpoint empties the write-ahead log file."""
+        temp_db_context.create(source='reddit', source_id='wal', title='WAL Test')
+        wal_path = temp_db_context.db_path + '-wal'
+        assert os.path.getsize(wal_path) > 0
+        
+        temp_db_context.checkpoint()
+        
+        assert os.path.getsize(wal_path) == 0
+    
+    def test_concurrent_writers(self, temp_db_context):
+        """Test that writes from several threads all land."""
+        def write(i):
+            return temp_db_context.create(
+                source='reddit', source_id=f'thread_{i}', title=f'Post {i}'
+            )
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(write, range(20)))
+        
+        assert all(result is not None for result in results)
+        assert temp_db_context.count() == 20
+    
+    def test_indexes_created(self, temp_db_context):
+        """Test that lookup and ordering indexes exist."""
+        with temp_db_context.engine.connect() as conn:
+            indexes = {
+                row[0] for row in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+        
+        assert {'ix_source_source_id', 'ix_score', 'ix_created_at',
+                'ix_updated_at'} <= indexes
+    
+    def test_in_memory_database_shared_across_sessions(self):
+        """Test that an in-memory database is visible to every session."""
+        db = DBContext(':memory:')
+        try:
+            db.create(source='reddit', source_id='mem_1', title='Memory 1')
+            db.create(source='reddit', source_id='mem_2', title='Memory 2')
+            
+            rows = db.iter_all()
+            first = next(rows)
+            assert db.read('reddit', 'mem_2') is not None
+            assert len([first, *rows]) == 2
+        finally:
+            db.close()
+    
+    def test_missing_index_added_to_existing_table(self, temp_db_context):
+        """Test that reopening a database creates indexes it lacks."""
+        with temp_db_context.engine.begin() as conn:
+            conn.exec_driver_sql('DROP INDEX ix_updated_at')
+        temp_db_context.close()
+        
+        db = DBContext(temp_db_context.db_path)
+        try:
+            with db.engine.connect() as conn:
+                index = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'ix_updated_at'"
+                ).first()
+        finally:
+            db.close()
+        
+        assert index is not None
+
+
 class TestScoreDictionary:
     """Tests for score dictionary functionality."""
     
@@ -386,6 +688,41 @@ class TestScoreDictionary:
         assert record.get_score_dict() == updated_dict
 
 
+    def test_score_dictionary_attribute_is_decoded(self, temp_db_context):
+        """Test score_dictionary round-trips as a dict without helper calls."""
+        temp_db_context.create(
+            source='reddit',
+            source_id='score_attr',
+            title='Test',
+            score_dictionary={'upvotes': 10}
+        )
+        
+        record = temp_db_context.read('reddit', 'score_attr')
+        assert record.score_dictionary == {'upvotes': 10}
+        assert json.loads(record.to_dict()['score_dictionary']) == {'upvotes': 10}
+    
+    def test_score_dictionary_accepts_json_string(self):
+        """Test assigning a JSON string stores the parsed value."""
+        record = RedditSource(source='reddit', source_id='s', title='t')
+        record.score_dictionary = '{"upvotes": 1}'
+        assert record.score_dictionary == {'upvotes': 1}
+        
+        with pytest.raises(ValueError):
+            record.score_dictionary = 'not json'
+    
+    def test_invalid_stored_json_loads_as_none(self, temp_db_context):
+        """Test rows with malformed stored JSON decode to None."""
+        temp_db_context.create(source='reddit', source_id='bad_json', title='Test')
+        with temp_db_context.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "UPDATE RedditSource SET score_dictionary = '{oops' "
+                "WHERE source_id = 'bad_json'"
+            )
+        
+        record = temp_db_context.read('reddit', 'bad_json')
+        assert record.get_score_dict() is None
+
+
 class TestProcessedField:
     """Tests for the processed field."""
     